@@ -3,7 +3,8 @@ from __future__ import annotations
 import os
 import re
 from dataclasses import dataclass
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable
 from urllib.parse import urljoin
 
 import requests
@@ -12,6 +13,11 @@ import yaml
 from regression.auth import AuthConfig, load_auth_config_from_env
 from regression.schema_validation import validate_schema
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 
 @dataclass(frozen=True)
 class HttpResult:
@@ -27,6 +33,10 @@ def _expand_env_vars(value: Any) -> Any:
     if not isinstance(value, str) or not value:
         return value
 
+    # Most values are plain literals; skip the regex engine entirely for those.
+    if "$" not in value and "%" not in value:
+        return value
+
     def _replace(m: re.Match[str]) -> str:
         name = m.group("braced") or m.group("bare") or m.group("windows")
         return os.getenv(name) or ""
@@ -34,9 +44,14 @@ def _expand_env_vars(value: Any) -> Any:
     return _ENV_VAR_PATTERN.sub(_replace, value)
 
 
-def _json_path_get(data: Any, dotted_path: str) -> Any:
+@lru_cache(maxsize=1024)
+def _split_path(dotted_path: str) -> tuple[str, ...]:
+    return tuple(dotted_path.split("."))
+
+
+def _json_path_get_parts(data: Any, parts: tuple[str, ...]) -> Any:
     cur: Any = data
-    for part in dotted_path.split("."):
+    for part in parts:
         if isinstance(cur, dict):
             cur = cur.get(part)
         else:
@@ -44,84 +59,280 @@ def _json_path_get(data: Any, dotted_path: str) -> Any:
     return cur
 
 
+def _json_path_get(data: Any, dotted_path: str) -> Any:
+    return _json_path_get_parts(data, _split_path(dotted_path))
+
+
+def _assert_exists(payload: Any, a: dict[str, Any], path: str, parts: tuple[str, ...]) -> None:
+    assert path, "json_path_exists requires 'path'"
+    value = _json_path_get_parts(payload, parts)
+    assert value is not None, f"Expected JSON path '{path}' to exist"
+
+
+def _assert_equals(payload: Any, a: dict[str, Any], path: str, parts: tuple[str, ...]) -> None:
+    assert path, "json_path_equals requires 'path'"
+    expected = a.get("expected")
+    actual = _json_path_get_parts(payload, parts)
+    assert actual == expected, f"Expected {path} == {expected!r}, got {actual!r}"
+
+
+def _assert_one_of(payload: Any, a: dict[str, Any], path: str, parts: tuple[str, ...]) -> None:
+    assert path, "json_path_one_of requires 'path'"
+    options = a.get("any_of")
+    assert isinstance(options, list) and options, "json_path_one_of requires non-empty any_of"
+    actual = _json_path_get_parts(payload, parts)
+    assert actual in options, f"Expected {path} in {options!r}, got {actual!r}"
+
+
+def _assert_range(payload: Any, a: dict[str, Any], path: str, parts: tuple[str, ...]) -> None:
+    assert path, "json_path_range requires 'path'"
+    actual = _json_path_get_parts(payload, parts)
+    assert actual is not None, f"Expected JSON path '{path}' to exist"
+    actual_num = float(actual)
+    min_v = a.get("min")
+    max_v = a.get("max")
+    if min_v is not None:
+        assert actual_num >= float(min_v), f"Expected {path} >= {min_v}, got {actual_num}"
+    if max_v is not None:
+        assert actual_num <= float(max_v), f"Expected {path} <= {max_v}, got {actual_num}"
+
+
+_ASSERTION_HANDLERS: dict[str, Callable[[Any, dict[str, Any], str, tuple[str, ...]], None]] = {
+    "json_path_exists": _assert_exists,
+    "json_path_equals": _assert_equals,
+    "json_path_one_of": _assert_one_of,
+    "json_path_range": _assert_range,
+}
+
+
 def _apply_assertions(payload: Any, assertions: list[dict[str, Any]]) -> None:
     for a in assertions:
         atype = (a.get("type") or "").strip()
+        handler = _ASSERTION_HANDLERS.get(atype)
+        if handler is None:
+            raise AssertionError(f"Unknown assertion type: {atype!r}")
+
         path = (a.get("path") or "").strip()
+        handler(payload, a, path, _split_path(path))
 
-        if atype == "json_path_exists":
-            assert path, "json_path_exists requires 'path'"
-            value = _json_path_get(payload, path)
-            assert value is not None, f"Expected JSON path '{path}' to exist"
-            continue
 
-        if atype == "json_path_equals":
-            assert path, "json_path_equals requires 'path'"
-            expected = a.get("expected")
-            actual = _json_path_get(payload, path)
-            assert actual == expected, f"Expected {path} == {expected!r}, got {actual!r}"
-            continue
+@dataclass(frozen=True)
+class _HeaderRule:
+    name: str
+    exists: bool = False
+    equals: str | None = None
+    contains: str | None = None
+    regex: re.Pattern[str] | None = None
+    # Literal text any match must contain (or start with, when anchored). Checked with
+    # str methods first so non-matching headers never reach the regex engine.
+    regex_literal: str | None = None
+    regex_anchored: bool = False
+    regex_exact: bool = False
 
-        if atype == "json_path_one_of":
-            assert path, "json_path_one_of requires 'path'"
-            options = a.get("any_of")
-            assert isinstance(options, list) and options, "json_path_one_of requires non-empty any_of"
-            actual = _json_path_get(payload, path)
-            assert actual in options, f"Expected {path} in {options!r}, got {actual!r}"
-            continue
 
-        if atype == "json_path_range":
-            assert path, "json_path_range requires 'path'"
-            actual = _json_path_get(payload, path)
-            assert actual is not None, f"Expected JSON path '{path}' to exist"
-            actual_num = float(actual)
-            if "min" in a and a["min"] is not None:
-                assert actual_num >= float(a["min"]), f"Expected {path} >= {a['min']}, got {actual_num}"
-            if "max" in a and a["max"] is not None:
-                assert actual_num <= float(a["max"]), f"Expected {path} <= {a['max']}, got {actual_num}"
-            continue
+@lru_cache(maxsize=512)
+def _compile_header_regex(rx: str) -> re.Pattern[str]:
+    return re.compile(rx)
+
+
+# Characters that have no special meaning outside a character class.
+_REGEX_LITERAL_RUN = re.compile(r"[A-Za-z0-9/_\- ]+")
 
-        raise AssertionError(f"Unknown assertion type: {atype!r}")
 
+def _regex_literal_hint(pattern: str) -> tuple[str, bool, bool] | None:
+    """Return (literal, anchored, exact) for a regex that begins with literal text.
 
-def _apply_expected_headers(resp: requests.Response, expected: dict[str, Any]) -> None:
+    `exact` means the whole pattern is that literal, so no regex is needed at all.
+    """
+
+    if "|" in pattern:
+        return None
+
+    anchored = pattern.startswith("^")
+    body = pattern[1:] if anchored else pattern
+    m = _REGEX_LITERAL_RUN.match(body)
+    if not m:
+        return None
+
+    literal = m.group()
+    rest = body[m.end() :]
+    if rest and rest[0] in "?*{":
+        # The quantifier makes the last literal character optional.
+        literal = literal[:-1]
+    if not literal:
+        return None
+
+    return literal, anchored, not rest
+
+
+def _regex_matches(rule: _HeaderRule, actual: str) -> bool:
+    if rule.regex_literal is not None:
+        if rule.regex_anchored:
+            hit = actual.startswith(rule.regex_literal)
+        else:
+            hit = rule.regex_literal in actual
+        if not hit or rule.regex_exact:
+            return hit
+    return rule.regex is not None and rule.regex.search(actual) is not None
+
+
+def _compile_expected_headers(expected: dict[str, Any]) -> list[_HeaderRule]:
+    rules: list[_HeaderRule] = []
     for raw_name, rule in expected.items():
         name = str(raw_name)
-        actual = resp.headers.get(name)
 
         # Shorthand: expected_headers: {"Content-Type": "application/json"}
         if isinstance(rule, str):
-            assert actual is not None, f"Expected header '{name}' to exist"
-            assert actual == rule, f"Expected header '{name}' == {rule!r}, got {actual!r}"
+            rules.append(_HeaderRule(name=name, equals=rule))
             continue
 
         if rule is True:
-            assert actual is not None, f"Expected header '{name}' to exist"
+            rules.append(_HeaderRule(name=name, exists=True))
             continue
 
         if isinstance(rule, dict):
-            if rule.get("exists"):
-                assert actual is not None, f"Expected header '{name}' to exist"
-
-            if "equals" in rule:
-                assert actual is not None, f"Expected header '{name}' to exist"
-                expected_value = str(rule.get("equals"))
-                assert actual == expected_value, f"Expected header '{name}' == {expected_value!r}, got {actual!r}"
-
-            if "contains" in rule:
-                assert actual is not None, f"Expected header '{name}' to exist"
-                needle = str(rule.get("contains"))
-                assert needle in actual, f"Expected header '{name}' to contain {needle!r}, got {actual!r}"
-
+            regex = None
+            hint = None
             if "regex" in rule:
-                assert actual is not None, f"Expected header '{name}' to exist"
                 rx = str(rule.get("regex"))
-                assert re.search(rx, actual), f"Expected header '{name}' to match /{rx}/, got {actual!r}"
-
+                regex = _compile_header_regex(rx)
+                hint = _regex_literal_hint(rx)
+
+            rules.append(
+                _HeaderRule(
+                    name=name,
+                    exists=bool(rule.get("exists")),
+                    equals=str(rule.get("equals")) if "equals" in rule else None,
+                    contains=str(rule.get("contains")) if "contains" in rule else None,
+                    regex=regex,
+                    regex_literal=hint[0] if hint else None,
+                    regex_anchored=hint[1] if hint else False,
+                    regex_exact=hint[2] if hint else False,
+                )
+            )
             continue
 
         raise AssertionError(f"Unsupported expected_headers rule for '{name}': {rule!r}")
 
+    return rules
+
+
+def _apply_expected_headers(resp: requests.Response, rules: list[_HeaderRule]) -> None:
+    for rule in rules:
+        name = rule.name
+        actual = resp.headers.get(name)
+
+        if rule.exists or rule.equals is not None or rule.contains is not None or rule.regex is not None:
+            assert actual is not None, f"Expected header '{name}' to exist"
+
+        if rule.equals is not None:
+            assert actual == rule.equals, f"Expected header '{name}' == {rule.equals!r}, got {actual!r}"
+
+        if rule.contains is not None:
+            assert rule.contains in actual, f"Expected header '{name}' to contain {rule.contains!r}, got {actual!r}"
+
+        if rule.regex is not None:
+            rx = rule.regex
+            assert _regex_matches(rule, actual), f"Expected header '{name}' to match /{rx.pattern}/, got {actual!r}"
+
+
+@dataclass(frozen=True)
+class PreparedCheck:
+    method: str
+    url: str
+    expected_status: int
+    schema_path: str | None
+    assertions: list[dict[str, Any]]
+    header_rules: list[_HeaderRule]
+    extra_headers: dict[str, str]
+    auth: AuthConfig
+
+
+_AUTH_OVERRIDE_ALIASES = {
+    "": "default",
+    "default": "default",
+    "none": "none",
+    "api_key": "api_key",
+    "apikey": "api_key",
+    "oauth2": "oauth2",
+    "bearer": "oauth2",
+}
+
+
+def _auth_for_override(mode: str, default_auth: AuthConfig) -> AuthConfig:
+    # An override naming the default's own mode would copy every field, so reuse the
+    # default instance instead: that keeps a single OAuth2 token cache for the run.
+    if mode == "default" or mode == default_auth.mode:
+        return default_auth
+    if mode == "none":
+        return AuthConfig(mode="none")
+    if mode == "api_key":
+        return AuthConfig(
+            mode="api_key",
+            api_key=default_auth.api_key,
+            api_key_header=default_auth.api_key_header,
+            api_key_query_param=default_auth.api_key_query_param,
+        )
+    return AuthConfig(
+        mode="oauth2",
+        bearer_token=default_auth.bearer_token,
+        oauth2_token_url=default_auth.oauth2_token_url,
+        oauth2_client_id=default_auth.oauth2_client_id,
+        oauth2_client_secret=default_auth.oauth2_client_secret,
+        oauth2_scope=default_auth.oauth2_scope,
+    )
+
+
+def _prepare_checks(checks: list[dict[str, Any]], *, base_url: str, default_auth: AuthConfig) -> list[PreparedCheck]:
+    """Interpret the static parts of each check once, so the request loop only does I/O.
+
+    Auth headers are still applied per request because OAuth2 tokens may need a refresh.
+    """
+
+    auth_cache: dict[str, AuthConfig] = {}
+    prepared: list[PreparedCheck] = []
+
+    for check in checks:
+        method = str(check.get("method") or "GET").upper()
+        path = str(_expand_env_vars(check.get("path") or ""))
+        assert path, "Each check needs a 'path'"
+
+        url = path if path.startswith(("http://", "https://")) else urljoin(base_url.rstrip("/") + "/", path.lstrip("/"))
+
+        # Allow per-check auth override: none|api_key|oauth2
+        auth_override = (check.get("auth") or "").strip().lower()
+        mode = _AUTH_OVERRIDE_ALIASES.get(auth_override)
+        if mode is None:
+            raise AssertionError(f"Unknown auth override: {auth_override!r}")
+        auth = auth_cache.get(mode)
+        if auth is None:
+            auth = auth_cache[mode] = _auth_for_override(mode, default_auth)
+
+        expected_headers = check.get("expected_headers") or {}
+        if expected_headers and not isinstance(expected_headers, dict):
+            raise AssertionError("check.expected_headers must be a mapping")
+
+        extra_headers = check.get("headers") or {}
+        if not isinstance(extra_headers, dict):
+            raise AssertionError("check.headers must be a mapping")
+
+        schema_path = check.get("schema")
+
+        prepared.append(
+            PreparedCheck(
+                method=method,
+                url=auth.apply_url(url),
+                expected_status=int(check.get("expected_status") or 200),
+                schema_path=str(schema_path) if schema_path else None,
+                assertions=list(check.get("assert") or []),
+                header_rules=_compile_expected_headers(dict(expected_headers)),
+                extra_headers={str(k): str(_expand_env_vars(v)) for k, v in extra_headers.items()},
+                auth=auth,
+            )
+        )
+
+    return prepared
+
 
 def run_contract_checks(contract_file: str, *, base_url: str | None = None, token: str | None = None) -> list[HttpResult]:
     """Run contract checks described in a YAML file.
@@ -136,13 +347,15 @@ def run_contract_checks(contract_file: str, *, base_url: str | None = None, toke
     """
 
     with open(contract_file, "r", encoding="utf-8") as f:
-        spec = yaml.safe_load(f) or {}
+        spec = yaml.load(f.read(), Loader=_SafeLoader) or {}
 
     base_url = base_url or os.getenv("SUT_BASE_URL") or ""
     base_url = str(_expand_env_vars(base_url)).strip()
     if not base_url:
         raise RuntimeError("base_url is required (pass base_url= or set SUT_BASE_URL)")
 
+    checks = spec.get("checks") or []
+
     session = requests.Session()
     base_headers = {"Accept": "application/json"}
 
@@ -158,54 +371,17 @@ def run_contract_checks(contract_file: str, *, base_url: str | None = None, toke
     verify_raw = (os.getenv("SUT_VERIFY_TLS") or "true").strip().lower()
     verify_tls = verify_raw not in ("0", "false", "no")
 
-    results: list[HttpResult] = []
-
-    for check in spec.get("checks") or []:
-        method = str(check.get("method") or "GET").upper()
-        path = str(_expand_env_vars(check.get("path") or ""))
-        assert path, "Each check needs a 'path'"
-
-        url = path if path.startswith(("http://", "https://")) else urljoin(base_url.rstrip("/") + "/", path.lstrip("/"))
-
-        # Allow per-check auth override: none|api_key|oauth2
-        auth_override = (check.get("auth") or "").strip().lower()
-        if auth_override in ("", "default"):
-            auth = default_auth
-        elif auth_override in ("none",):
-            auth = AuthConfig(mode="none")
-        elif auth_override in ("api_key", "apikey"):
-            auth = AuthConfig(
-                mode="api_key",
-                api_key=default_auth.api_key,
-                api_key_header=default_auth.api_key_header,
-                api_key_query_param=default_auth.api_key_query_param,
-            )
-        elif auth_override in ("oauth2", "bearer"):
-            auth = AuthConfig(
-                mode="oauth2",
-                bearer_token=default_auth.bearer_token,
-                oauth2_token_url=default_auth.oauth2_token_url,
-                oauth2_client_id=default_auth.oauth2_client_id,
-                oauth2_client_secret=default_auth.oauth2_client_secret,
-                oauth2_scope=default_auth.oauth2_scope,
-            )
-        else:
-            raise AssertionError(f"Unknown auth override: {auth_override!r}")
+    prepared = _prepare_checks(checks, base_url=base_url, default_auth=default_auth)
 
-        url = auth.apply_url(url)
+    results: list[HttpResult] = []
 
-        expected_status = int(check.get("expected_status") or 200)
-        schema_path = check.get("schema")
-        assertions = check.get("assert") or []
-        expected_headers = check.get("expected_headers") or {}
-        if expected_headers and not isinstance(expected_headers, dict):
-            raise AssertionError("check.expected_headers must be a mapping")
+    for pc in prepared:
+        method = pc.method
+        url = pc.url
+        expected_status = pc.expected_status
 
-        headers = auth.apply_headers(base_headers)
-        extra_headers = check.get("headers") or {}
-        if not isinstance(extra_headers, dict):
-            raise AssertionError("check.headers must be a mapping")
-        headers.update({str(k): str(_expand_env_vars(v)) for k, v in extra_headers.items()})
+        headers = pc.auth.apply_headers(base_headers)
+        headers.update(pc.extra_headers)
 
         resp = session.request(method, url, headers=headers, timeout=timeout_s, verify=verify_tls)
 
@@ -215,18 +391,18 @@ def run_contract_checks(contract_file: str, *, base_url: str | None = None, toke
         ), f"{method} {url}: expected status {expected_status}, got {resp.status_code}"
 
         # Response header validation (content-type, pagination, request IDs, etc)
-        if expected_headers:
-            _apply_expected_headers(resp, dict(expected_headers))
+        if pc.header_rules:
+            _apply_expected_headers(resp, pc.header_rules)
 
         # JSON parsing + schema validation
         payload = resp.json() if resp.content else None
-        if schema_path:
-            validate_schema(str(schema_path), payload)
+        if pc.schema_path:
+            validate_schema(pc.schema_path, payload)
 
         # Business logic / data accuracy assertions
-        if assertions:
+        if pc.assertions:
             assert isinstance(payload, (dict, list)), f"{method} {url}: payload not JSON object/array"
-            _apply_assertions(payload, list(assertions))
+            _apply_assertions(payload, pc.assertions)
 
         results.append(HttpResult(url=url, status_code=resp.status_code, json=payload))
 
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-import json
 import os
 import re
-import threading
 import time
+from collections import deque
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from typing import Any
 
+from regression.json_codec import dumps_bytes
 from regression.redaction import redact_text, redact_url
 
 
@@ -22,8 +22,9 @@ class ApiCall:
     error: str | None
 
 
-_LOCK = threading.Lock()
-_CALLS: list[ApiCall] = []
+# deque.append and list(deque) are atomic under the GIL, so recording a call from
+# concurrent HTTP threads needs no explicit lock.
+_CALLS: deque[ApiCall] = deque()
 
 
 def record_api_call(
@@ -35,22 +36,33 @@ def record_api_call(
     elapsed_ms: float,
     error: str | None,
 ) -> None:
-    with _LOCK:
-        _CALLS.append(
-            ApiCall(
-                method=method,
-                url=url,
-                status_code=status_code,
-                ok=ok,
-                elapsed_ms=float(elapsed_ms),
-                error=error,
-            )
+    _CALLS.append(
+        ApiCall(
+            method=method,
+            url=url,
+            status_code=status_code,
+            ok=ok,
+            elapsed_ms=float(elapsed_ms),
+            error=error,
         )
+    )
 
 
 def get_api_calls() -> list[ApiCall]:
-    with _LOCK:
-        return list(_CALLS)
+    return list(_CALLS)
+
+
+def _rank_index(n: int, p: float) -> int:
+    # round() of a value in [0, n-1] is always a valid index, so no clamping needed.
+    return round((p / 100.0) * (n - 1))
+
+
+def _latency_stats(latencies: list[float]) -> tuple[float, float, float]:
+    """Return (p50, p95, max) using nearest-rank on the sorted latencies."""
+
+    n = len(latencies)
+    latencies.sort()
+    return float(latencies[_rank_index(n, 50)]), float(latencies[_rank_index(n, 95)]), float(latencies[-1])
 
 
 def summarize_calls(calls: list[ApiCall]) -> dict[str, Any]:
@@ -80,6 +92,8 @@ def summarize_calls(calls: list[ApiCall]) -> dict[str, Any]:
 
     by_url: dict[str, dict[str, Any]] = {}
     by_label: dict[str, dict[str, Any]] = {}
+    latencies_by_url: dict[str, list[float]] = {}
+    total_errors = 0
 
     for c in calls:
         safe_url = redact_url(c.url)
@@ -112,6 +126,10 @@ def summarize_calls(calls: list[ApiCall]) -> dict[str, Any]:
             },
         )
 
+        latencies_by_url.setdefault(safe_url, []).append(c.elapsed_ms)
+        if not c.ok or c.error is not None:
+            total_errors += 1
+
         entry["count"] += 1
         lentry["count"] += 1
         if c.ok and c.error is None and (c.status_code is None or 200 <= c.status_code < 400):
@@ -127,22 +145,11 @@ def summarize_calls(calls: list[ApiCall]) -> dict[str, Any]:
 
     # latency stats
     for url, entry in by_url.items():
-        latencies = [c.elapsed_ms for c in calls if redact_url(c.url) == url]
-        latencies.sort()
-        if not latencies:
-            continue
-
-        def pct(p: float) -> float:
-            i = int(round((p / 100.0) * (len(latencies) - 1)))
-            return float(latencies[max(0, min(i, len(latencies) - 1))])
-
-        entry["p50_ms"] = pct(50)
-        entry["p95_ms"] = pct(95)
-        entry["max_ms"] = float(latencies[-1])
+        entry["p50_ms"], entry["p95_ms"], entry["max_ms"] = _latency_stats(latencies_by_url[url])
 
     return {
         "total_calls": len(calls),
-        "total_errors": sum(1 for c in calls if not c.ok or c.error is not None),
+        "total_errors": total_errors,
         "labels": sorted(by_label.values(), key=lambda x: (x["error_count"], x["count"], x["label"]), reverse=True),
         "endpoints": sorted(by_url.values(), key=lambda x: (x["error_count"], x["count"], x["url"]), reverse=True),
     }
@@ -172,7 +179,7 @@ def write_api_report(path: str) -> str:
     }
 
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2, sort_keys=False)
+    with open(path, "wb") as f:
+        f.write(dumps_bytes(report))
 
     return path
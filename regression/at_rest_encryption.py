@@ -2,13 +2,26 @@ from __future__ import annotations
 
 import base64
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Final
 
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
 
 _KEY_ENV_VAR: Final[str] = "ARTIFACT_ENCRYPTION_KEY"
+_STREAM_ENV_VAR: Final[str] = "ARTIFACT_ENCRYPTION_STREAM"
+
+# Streamed format: MAGIC || nonce(12) || ciphertext || tag(16), AES-256-GCM.
+_STREAM_MAGIC: Final[bytes] = b"ARTGCM1\0"
+_STREAM_NONCE_LEN: Final[int] = 12
+_STREAM_TAG_LEN: Final[int] = 16
+_STREAM_THRESHOLD_BYTES = 16 * 1024 * 1024
+_STREAM_CHUNK_BYTES = 1024 * 1024
 
 
 def _looks_like_hex(s: str) -> bool:
@@ -34,13 +47,19 @@ def _load_fernet_key_from_env(env_var: str = _KEY_ENV_VAR) -> bytes | None:
     return raw.encode("utf-8")
 
 
+@lru_cache(maxsize=4)
+def _get_fernet_cached(key: bytes) -> Fernet:
+    # Keyed on the key bytes, so rotating the env var yields a fresh instance.
+    return Fernet(key)
+
+
 def get_fernet(env_var: str = _KEY_ENV_VAR) -> Fernet | None:
     key = _load_fernet_key_from_env(env_var)
     if not key:
         return None
 
     try:
-        return Fernet(key)
+        return _get_fernet_cached(key)
     except Exception as e:  # pragma: no cover
         raise ValueError(f"Invalid Fernet key in env var {env_var!r}") from e
 
@@ -63,6 +82,92 @@ def decrypt_bytes(ciphertext: bytes, *, env_var: str = _KEY_ENV_VAR) -> bytes:
         raise ValueError("Invalid ciphertext or wrong key") from e
 
 
+def _stream_enabled() -> bool:
+    return (os.getenv(_STREAM_ENV_VAR) or "").strip().lower() in ("1", "true", "yes")
+
+
+def _stream_key(fernet_key: bytes) -> bytes:
+    # Derive a separate AES-256 key rather than reusing the Fernet key bytes directly.
+    return HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=b"artifact-stream-aes-gcm").derive(
+        base64.urlsafe_b64decode(fernet_key)
+    )
+
+
+def _encrypt_file_stream(src: Path, dst: Path, key: bytes) -> None:
+    nonce = os.urandom(_STREAM_NONCE_LEN)
+    encryptor = Cipher(algorithms.AES(_stream_key(key)), modes.GCM(nonce)).encryptor()
+
+    buf = bytearray(_STREAM_CHUNK_BYTES)
+    out_buf = bytearray(_STREAM_CHUNK_BYTES + 15)
+    view, out_view = memoryview(buf), memoryview(out_buf)
+
+    with src.open("rb") as fin, dst.open("wb") as fout:
+        fout.write(_STREAM_MAGIC + nonce)
+        while n := fin.readinto(buf):
+            m = encryptor.update_into(view[:n], out_buf)
+            fout.write(out_view[:m])
+        fout.write(encryptor.finalize())
+        fout.write(encryptor.tag)
+
+
+def _decrypt_file_stream(src: Path, dst: Path, key: bytes) -> None:
+    size = src.stat().st_size
+    header_len = len(_STREAM_MAGIC) + _STREAM_NONCE_LEN
+    remaining = size - header_len - _STREAM_TAG_LEN
+    if remaining < 0:
+        raise ValueError("Invalid ciphertext or wrong key")
+
+    with src.open("rb") as fin:
+        fin.seek(size - _STREAM_TAG_LEN)
+        tag = fin.read(_STREAM_TAG_LEN)
+        fin.seek(len(_STREAM_MAGIC))
+        nonce = fin.read(_STREAM_NONCE_LEN)
+
+        decryptor = Cipher(algorithms.AES(_stream_key(key)), modes.GCM(nonce, tag)).decryptor()
+        tmp = dst.with_name(dst.name + ".part")
+        try:
+            with tmp.open("wb") as fout:
+                while remaining:
+                    chunk = fin.read(min(_STREAM_CHUNK_BYTES, remaining))
+                    if not chunk:
+                        # The file shrank after stat(); never spin on a short read.
+                        raise ValueError("Invalid ciphertext or wrong key")
+                    remaining -= len(chunk)
+                    fout.write(decryptor.update(chunk))
+                decryptor.finalize()
+        except InvalidTag as e:
+            tmp.unlink(missing_ok=True)
+            raise ValueError("Invalid ciphertext or wrong key") from e
+        except BaseException:
+            # The partial file holds unauthenticated plaintext; never leave it behind.
+            tmp.unlink(missing_ok=True)
+            raise
+        tmp.replace(dst)
+
+
+def decrypt_file(
+    encrypted_path: str | Path,
+    out_path: str | Path,
+    *,
+    env_var: str = _KEY_ENV_VAR,
+) -> str:
+    """Decrypt an artifact written by write_encrypted_copy_if_configured (either format)."""
+
+    key = _load_fernet_key_from_env(env_var)
+    if not key:
+        raise RuntimeError(f"Missing encryption key (set {env_var})")
+
+    src, dst = Path(encrypted_path), Path(out_path)
+    with src.open("rb") as fin:
+        magic = fin.read(len(_STREAM_MAGIC))
+
+    if magic == _STREAM_MAGIC:
+        _decrypt_file_stream(src, dst, key)
+    else:
+        dst.write_bytes(decrypt_bytes(src.read_bytes(), env_var=env_var))
+    return str(dst)
+
+
 def write_encrypted_copy_if_configured(
     plaintext_path: str | Path,
     *,
@@ -73,6 +178,9 @@ def write_encrypted_copy_if_configured(
 
     If the key env var is unset, this is a no-op.
 
+    Files above 16 MiB are streamed through AES-256-GCM instead of Fernet when
+    ARTIFACT_ENCRYPTION_STREAM=1; read those back with decrypt_file().
+
     Returns the encrypted path if written, else None.
     """
 
@@ -87,6 +195,10 @@ def write_encrypted_copy_if_configured(
     out = Path(out_path) if out_path is not None else p.with_suffix(p.suffix + ".enc")
     out.parent.mkdir(parents=True, exist_ok=True)
 
+    if _stream_enabled() and p.stat().st_size > _STREAM_THRESHOLD_BYTES:
+        _encrypt_file_stream(p, out, _load_fernet_key_from_env(env_var) or b"")
+        return str(out)
+
     ciphertext = f.encrypt(p.read_bytes())
     out.write_bytes(ciphertext)
     return str(out)
@@ -10,6 +10,14 @@ from typing import Any
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 import requests
+from requests.adapters import HTTPAdapter
+
+
+# Shared session for token-endpoint calls so refreshes reuse keep-alive connections
+# to the IdP instead of paying a fresh TCP+TLS handshake per fetch.
+_TOKEN_SESSION = requests.Session()
+_TOKEN_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_TOKEN_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
 
 
 @dataclass
@@ -159,7 +167,7 @@ def _fetch_client_credentials_token(
     verify_raw = (os.getenv("SUT_VERIFY_TLS") or "true").strip().lower()
     verify_tls = verify_raw not in ("0", "false", "no")
 
-    resp = requests.post(token_url, data=data, headers=headers, timeout=timeout_s, verify=verify_tls)
+    resp = _TOKEN_SESSION.post(token_url, data=data, headers=headers, timeout=timeout_s, verify=verify_tls)
     resp.raise_for_status()
 
     payload: Any = resp.json() if resp.content else {}
@@ -13,13 +13,46 @@ class DbCheck:
     expected: Any | None = None
 
 
-def run_sqlite_checks(db_path: str, checks: list[DbCheck]) -> None:
-    conn = sqlite3.connect(db_path)
+def _is_inlinable(query: str) -> bool:
+    q = query.strip().lower()
+    return q.startswith(("select", "with")) and ";" not in q
+
+
+def _run_batched(conn: sqlite3.Connection, queries: list[str]) -> dict[str, Any]:
+    """Evaluate scalar queries as one `SELECT (q1), (q2), ...` statement.
+
+    A scalar subquery yields the first column of the first row (NULL when empty), which
+    matches the per-query `fetchone()[0]` semantics. Anything SQLite rejects (multi-column
+    subqueries, etc.) falls back to per-check execution by returning no values.
+    """
+
+    inlinable = [q for q in dict.fromkeys(queries) if _is_inlinable(q)]
+    if not inlinable:
+        return {}
+
+    combined = "SELECT " + ", ".join(f"({q.strip()})" for q in inlinable)
+    try:
+        row = conn.execute(combined).fetchone()
+    except sqlite3.Error:
+        return {}
+    return dict(zip(inlinable, row))
+
+
+def run_sqlite_checks(db_path: str, checks: list[DbCheck], *, batch: bool = False) -> None:
+    # Autocommit mode + one explicit read transaction: every check sees the same snapshot,
+    # and identical query text is only executed once.
+    conn = sqlite3.connect(db_path, isolation_level=None, cached_statements=256)
     try:
+        conn.execute("PRAGMA query_only=ON")
+        conn.execute("BEGIN")
+
+        values: dict[str, Any] = _run_batched(conn, [c.query for c in checks]) if batch else {}
         for c in checks:
-            cur = conn.execute(c.query)
-            row = cur.fetchone()
-            value = None if row is None else row[0]
+            if c.query not in values:
+                row = conn.execute(c.query).fetchone()
+                values[c.query] = None if row is None else row[0]
+            value = values[c.query]
+
             if c.expected is not None:
                 assert value == c.expected, f"DB check '{c.name}': expected {c.expected!r}, got {value!r}"
             else:
@@ -38,6 +71,8 @@ def maybe_validate_backend_db() -> None:
     Then create a YAML file listing checks and set:
     - DB_CHECKS_FILE=path/to/db_checks.yaml
 
+    Optionally set DB_BATCH_QUERIES=1 to evaluate simple SELECT checks in a single statement.
+
     If not configured, this does nothing.
     """
 
@@ -58,8 +93,13 @@ def maybe_validate_backend_db() -> None:
 
     import yaml
 
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader
+
     with open(checks_file, "r", encoding="utf-8") as f:
-        spec = yaml.safe_load(f) or {}
+        spec = yaml.load(f.read(), Loader=SafeLoader) or {}
 
     checks: list[DbCheck] = []
     for item in spec.get("checks") or []:
@@ -71,4 +111,5 @@ def maybe_validate_backend_db() -> None:
             )
         )
 
-    run_sqlite_checks(db_path, checks)
+    batch_raw = (os.getenv("DB_BATCH_QUERIES") or "").strip().lower()
+    run_sqlite_checks(db_path, checks, batch=batch_raw in ("1", "true", "yes"))
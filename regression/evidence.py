@@ -1,17 +1,22 @@
 from __future__ import annotations
 
 import hashlib
-import json
+import io
+import mmap
 import os
 import platform
+import stat
 import sys
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from regression.redaction import redact_text
+from regression.json_codec import dumps_bytes
+from regression.redaction import redact_text, redact_values
 
 
 @dataclass(frozen=True)
@@ -27,6 +32,29 @@ def _read_text(path: Path) -> str | None:
         return None
 
 
+@lru_cache(maxsize=8)
+def _parse_packed_refs(path: str, mtime_ns: int) -> dict[str, str]:
+    # mtime_ns is only part of the cache key, so a rewritten packed-refs is re-parsed.
+    text = _read_text(Path(path)) or ""
+    refs: dict[str, str] = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line[0] in "#^" or " " not in line:
+            continue
+        sha, name = line.split(" ", 1)
+        refs[name.strip()] = sha.strip()
+    return refs
+
+
+def _read_packed_refs(git_dir: Path) -> dict[str, str]:
+    path = git_dir / "packed-refs"
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return {}
+    return _parse_packed_refs(str(path), mtime_ns)
+
+
 def get_git_info(repo_root: str | Path) -> GitInfo:
     root = Path(repo_root)
     git_dir = root / ".git"
@@ -42,31 +70,36 @@ def get_git_info(repo_root: str | Path) -> GitInfo:
             return GitInfo(head=ref_txt, branch=branch)
 
         # Packed refs fallback
-        packed = _read_text(git_dir / "packed-refs")
-        if packed:
-            for line in packed.splitlines():
-                line = line.strip()
-                if not line or line.startswith("#") or line.startswith("^"):
-                    continue
-                if " " not in line:
-                    continue
-                sha, name = line.split(" ", 1)
-                if name.strip() == ref:
-                    return GitInfo(head=sha.strip(), branch=branch)
-
-        return GitInfo(head=None, branch=branch)
+        sha = _read_packed_refs(git_dir).get(ref)
+        return GitInfo(head=sha, branch=branch)
 
     # Detached HEAD
     return GitInfo(head=head_txt, branch=None)
 
 
-def sha256_file(path: str | Path) -> str:
+_HASH_CHUNK_SIZE = io.DEFAULT_BUFFER_SIZE * 64
+# Files at least this large are hashed through mmap when the caller already knows the size.
+_HASH_MMAP_THRESHOLD = 64 * 1024 * 1024
+
+
+def sha256_file(path: str | Path, *, size_hint: int | None = None) -> str:
     p = Path(path)
-    h = hashlib.sha256()
     with p.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        if size_hint is not None and size_hint >= _HASH_MMAP_THRESHOLD:
+            # One update over the mapped file; hashlib releases the GIL for large buffers.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest()
+
+        # Python 3.11+: the read/update loop runs in C.
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+        h = hashlib.sha256()
+        buf = bytearray(_HASH_CHUNK_SIZE)
+        view = memoryview(buf)
+        while n := f.readinto(buf):
+            h.update(view[:n])
+        return h.hexdigest()
 
 
 def write_evidence_bundle(
@@ -88,28 +121,32 @@ def write_evidence_bundle(
     repo_root = Path(repo_root) if repo_root is not None else Path.cwd()
     git = get_git_info(repo_root)
 
-    artifacts: list[dict[str, Any]] = []
+    paths: list[str] = []
+    if api_report_path:
+        paths.append(api_report_path)
+    paths.extend(extra_artifacts or [])
 
-    def _add_artifact(p: str) -> None:
+    def _hash_artifact(p: str) -> dict[str, Any] | None:
         try:
-            ap = Path(p)
-            if not ap.exists() or not ap.is_file():
-                return
-            artifacts.append(
-                {
-                    "path": str(ap.as_posix()),
-                    "sha256": sha256_file(ap),
-                    "bytes": ap.stat().st_size,
-                }
-            )
+            st = os.stat(p)
+            if not stat.S_ISREG(st.st_mode):
+                return None
+            return {
+                "path": str(Path(p).as_posix()),
+                "sha256": sha256_file(p, size_hint=st.st_size),
+                "bytes": st.st_size,
+            }
         except Exception:
-            return
+            return None
 
-    if api_report_path:
-        _add_artifact(api_report_path)
+    # hashlib releases the GIL while digesting, so larger bundles hash in parallel.
+    if len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as ex:
+            hashed = list(ex.map(_hash_artifact, paths))
+    else:
+        hashed = [_hash_artifact(p) for p in paths]
 
-    for a in extra_artifacts or []:
-        _add_artifact(a)
+    artifacts = [a for a in hashed if a is not None]
 
     manifest = {
         "run_id": str(uuid.uuid4()),
@@ -128,9 +165,6 @@ def write_evidence_bundle(
         "artifacts": artifacts,
     }
 
-    # Final safety pass: redact bearer/basic patterns anywhere in the JSON string.
-    text = json.dumps(manifest, indent=2, sort_keys=False)
-    text = redact_text(text)
-
-    out_path.write_text(text, encoding="utf-8")
+    # Safety pass: redact bearer/basic patterns in every string value before serializing.
+    out_path.write_bytes(dumps_bytes(redact_values(manifest)))
     return str(out_path)
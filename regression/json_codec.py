@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is always available
+    orjson = None  # type: ignore[assignment]
+
+
+def _no_default(obj: Any) -> Any:
+    # Same error the stdlib encoder raises, so both backends reject the same objects.
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _finite_or_none(obj: Any) -> Any:
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _finite_or_none(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite_or_none(v) for v in obj]
+    return obj
+
+
+def dumps_bytes(obj: Any, *, indent: bool = True, sort_keys: bool = False) -> bytes:
+    """Serialize to JSON bytes with orjson when installed, else with the stdlib encoder.
+
+    Both backends write NaN and Infinity as null and raise TypeError for objects JSON cannot represent.
+    """
+
+    if orjson is not None:
+        option = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=_no_default, option=option)
+        except (TypeError, orjson.JSONEncodeError):
+            # Non-str keys, integers beyond 64 bits, ...: leave those to the stdlib.
+            pass
+
+    kwargs: dict[str, Any] = {"indent": 2} if indent else {"separators": (",", ":")}
+    try:
+        text = json.dumps(obj, allow_nan=False, sort_keys=sort_keys, **kwargs)
+    except ValueError as exc:
+        if "Out of range float" not in str(exc):
+            raise
+        # Match orjson: non-finite floats become null instead of NaN/Infinity literals.
+        text = json.dumps(_finite_or_none(obj), allow_nan=False, sort_keys=sort_keys, **kwargs)
+    return text.encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON, using orjson when installed.
+
+    Documents orjson refuses (e.g. NaN/Infinity literals in reports written by older
+    versions) are re-parsed by the stdlib.
+    """
+
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def load_json_file(path: str | Path, *, data: bytes | None = None) -> Any:
+    """Parse a JSON file.
+
+    Pass `data` when the caller already holds the file's bytes (e.g. after hashing them)
+    to skip the second read.
+    """
+
+    return loads(data if data is not None else Path(path).read_bytes())
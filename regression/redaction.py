@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import os
 import re
+from functools import lru_cache
+from typing import Any
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 
@@ -21,24 +23,34 @@ _DEFAULT_SENSITIVE_KEYS = {
 
 _BEARER_RE = re.compile(r"\bBearer\s+[^\s]+", re.IGNORECASE)
 _BASIC_RE = re.compile(r"\bBasic\s+[^\s]+", re.IGNORECASE)
+# One cheap scan to decide whether either substitution can possibly apply.
+_CREDENTIAL_HINT_RE = re.compile(r"bearer|basic", re.IGNORECASE)
 
 
-def _get_sensitive_query_keys() -> set[str]:
+# Same as: "token" in k or "secret" in k or (k.endswith("key") and k != "monkey")
+_SENSITIVE_KEY_HEURISTIC = re.compile(r"token|secret|^(?!monkey\Z).*key\Z", re.DOTALL)
+
+
+@lru_cache(maxsize=4)
+def _sensitive_keys_cached(api_key_query_param: str, extra: str) -> frozenset[str]:
     keys = set(_DEFAULT_SENSITIVE_KEYS)
 
     # Include the configured API-key query param if present.
-    k = (os.getenv("SUT_API_KEY_QUERY_PARAM") or "").strip().lower()
+    k = api_key_query_param.strip().lower()
     if k:
         keys.add(k)
 
-    extra = (os.getenv("SENSITIVE_QUERY_PARAMS") or "").strip()
-    if extra:
-        for part in extra.split(","):
-            p = part.strip().lower()
-            if p:
-                keys.add(p)
+    for part in extra.split(","):
+        p = part.strip().lower()
+        if p:
+            keys.add(p)
+
+    return frozenset(keys)
+
 
-    return keys
+def _get_sensitive_query_keys() -> frozenset[str]:
+    # Cached on the raw env values, so the set is only rebuilt when they change.
+    return _sensitive_keys_cached(os.getenv("SUT_API_KEY_QUERY_PARAM") or "", os.getenv("SENSITIVE_QUERY_PARAMS") or "")
 
 
 def redact_url(url: str) -> str:
@@ -47,15 +59,39 @@ def redact_url(url: str) -> str:
     if not url:
         return url
 
-    sensitive = _get_sensitive_query_keys()
+    return _redact_url_cached(url, _get_sensitive_query_keys())
+
+
+# Plain ASCII key=value pairs joined by "&": no percent-escapes or "+" whose decoded form
+# could hide a sensitive key from a raw substring check.
+_CANONICAL_QUERY_RE = re.compile(r"[A-Za-z0-9_.~-]+=[A-Za-z0-9_.~-]*(?:&[A-Za-z0-9_.~-]+=[A-Za-z0-9_.~-]*)*")
+
+
+@lru_cache(maxsize=4)
+def _query_hint_re(sensitive: frozenset[str]) -> re.Pattern[str]:
+    # Superset of what the per-key checks below can match: the heuristic's substrings
+    # plus every configured key.
+    alternatives = ["token", "secret", "key", *sorted(re.escape(k) for k in sensitive)]
+    return re.compile("|".join(alternatives), re.IGNORECASE)
+
+
+# Reports redact the same handful of URLs many times. The sensitive-key set is part of
+# the cache key so env changes (SENSITIVE_QUERY_PARAMS etc.) are still honoured.
+@lru_cache(maxsize=4096)
+def _redact_url_cached(url: str, sensitive: frozenset[str]) -> str:
     parsed = urlparse(url)
     if not parsed.query:
         return url
 
+    # Fast path: a query already in urlencode's canonical form with no sensitive-looking
+    # substring would round-trip unchanged, so skip parse_qsl/urlencode.
+    if _CANONICAL_QUERY_RE.fullmatch(parsed.query) and not _query_hint_re(sensitive).search(parsed.query):
+        return urlunparse(parsed)
+
     q = []
     for k, v in parse_qsl(parsed.query, keep_blank_values=True):
         kl = (k or "").lower()
-        if kl in sensitive or "token" in kl or "secret" in kl or (kl.endswith("key") and kl != "monkey"):
+        if kl in sensitive or _SENSITIVE_KEY_HEURISTIC.search(kl):
             q.append((k, "REDACTED"))
         else:
             q.append((k, v))
@@ -66,9 +102,26 @@ def redact_url(url: str) -> str:
 def redact_text(text: str) -> str:
     """Redact bearer/basic credentials from any free-form text."""
 
-    if not text:
+    if not text or not _CREDENTIAL_HINT_RE.search(text):
         return text
 
     text = _BEARER_RE.sub("Bearer REDACTED", text)
     text = _BASIC_RE.sub("Basic REDACTED", text)
     return text
+
+
+
+def redact_values(obj: Any) -> Any:
+    """Apply redact_text to every string in a JSON-like structure.
+
+    Redacting values (rather than the serialized document) keeps the output valid JSON:
+    the credential regexes can't swallow the closing quote of a string.
+    """
+
+    if isinstance(obj, str):
+        return redact_text(obj)
+    if isinstance(obj, dict):
+        return {k: redact_values(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [redact_values(v) for v in obj]
+    return obj
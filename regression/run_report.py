@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-import json
+import hashlib
+import os
+import stat
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from regression.evidence import get_git_info, sha256_file
-from regression.redaction import redact_text
+from regression.evidence import get_git_info
+from regression.json_codec import dumps_bytes, load_json_file
+from regression.redaction import redact_values
 
 
 @dataclass(frozen=True)
@@ -17,25 +20,41 @@ class ArtifactRef:
     bytes: int
 
 
-def _artifact_ref(path: str | None) -> ArtifactRef | None:
-    if not path:
-        return None
+@dataclass(frozen=True)
+class RunReportResult:
+    """What write_run_report wrote, plus the parsed artifacts, for the HTML report."""
 
-    p = Path(path)
-    if not p.exists() or not p.is_file():
-        return None
+    path: str
+    report: dict[str, Any]
+    api_report: Any | None
+    evidence: Any | None
 
-    return ArtifactRef(path=str(p.as_posix()), sha256=sha256_file(p), bytes=p.stat().st_size)
 
+def _load_artifact(path: str | None, obj: Any | None = None) -> tuple[ArtifactRef | None, Any | None]:
+    """Return (artifact ref, parsed JSON) for a report file, reading it from disk once.
+
+    If the caller already holds the parsed document, pass it as ``obj`` to skip re-parsing;
+    the hash and size still come from the bytes on disk.
+    """
 
-def _try_read_json(path: str | None) -> Any | None:
     if not path:
-        return None
+        return None, None
 
     try:
-        return json.loads(Path(path).read_text(encoding="utf-8"))
+        st = os.stat(path)
+        if not stat.S_ISREG(st.st_mode):
+            return None, None
+        data = Path(path).read_bytes()
+    except OSError:
+        return None, None
+
+    ref = ArtifactRef(path=Path(path).as_posix(), sha256=hashlib.sha256(data).hexdigest(), bytes=len(data))
+    if obj is not None:
+        return ref, obj
+    try:
+        return ref, load_json_file(path, data=data)
     except Exception:
-        return None
+        return ref, None
 
 
 def write_run_report(
@@ -48,7 +67,10 @@ def write_run_report(
     api_report_path: str | None,
     evidence_path: str | None,
     repo_root: str | Path | None = None,
-) -> str:
+    generated_at: str | None = None,
+    api_report_obj: Any | None = None,
+    evidence_obj: Any | None = None,
+) -> RunReportResult:
     """Write a consolidated run report that points to all artifacts.
 
     This is meant as a single file you can hand to a stakeholder:
@@ -56,6 +78,13 @@ def write_run_report(
     - what happened (pytest summary)
     - what was produced (artifact hashes)
     - safe to share (redaction pass)
+
+    ``api_report_obj`` / ``evidence_obj`` may carry the already-parsed contents of the
+    artifact files, so they are not decoded again. They are embedded through the same
+    per-value redaction as the rest of the report; hashes and sizes still come from disk.
+
+    Returns the written (redacted) report together with the parsed artifacts, so callers
+    such as write_html_report don't read and parse the files again.
     """
 
     out_path = Path(path)
@@ -64,18 +93,15 @@ def write_run_report(
     repo_root = Path(repo_root) if repo_root is not None else Path.cwd()
     git = get_git_info(repo_root)
 
-    api_ref = _artifact_ref(api_report_path)
-    evidence_ref = _artifact_ref(evidence_path)
+    api_ref, api_json = _load_artifact(api_report_path, api_report_obj)
+    evidence_ref, evidence_json = _load_artifact(evidence_path, evidence_obj)
 
     api_summary = None
-    api_json = _try_read_json(api_report_path)
     if isinstance(api_json, dict):
         api_summary = api_json.get("summary")
 
-    evidence_json = _try_read_json(evidence_path)
-
     report = {
-        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "generated_at": generated_at or datetime.now(timezone.utc).isoformat(),
         "git": {"head": git.head, "branch": git.branch},
         "pytest": {
             "exitstatus": exitstatus,
@@ -93,8 +119,6 @@ def write_run_report(
         "evidence": evidence_json if isinstance(evidence_json, dict) else None,
     }
 
-    text = json.dumps(report, indent=2, sort_keys=False)
-    text = redact_text(text)
-
-    out_path.write_text(text, encoding="utf-8")
-    return str(out_path)
+    safe_report = redact_values(report)
+    out_path.write_bytes(dumps_bytes(safe_report))
+    return RunReportResult(path=str(out_path), report=safe_report, api_report=api_json, evidence=evidence_json)
@@ -9,18 +9,31 @@ from jsonschema import Draft202012Validator
 
 
 @lru_cache(maxsize=128)
+def _load_validator_cached(schema_path: str, mtime_ns: int) -> Draft202012Validator:
+    # mtime_ns is only part of the cache key, so an edited schema is rebuilt.
+    schema = json.loads(Path(schema_path).read_text(encoding="utf-8"))
+    return Draft202012Validator(schema)
+
+
 def load_json_schema(schema_path: str) -> Draft202012Validator:
-    path = Path(schema_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Schema not found: {schema_path}")
+    try:
+        mtime_ns = Path(schema_path).stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Schema not found: {schema_path}") from None
+    return _load_validator_cached(schema_path, mtime_ns)
 
-    schema = json.loads(path.read_text(encoding="utf-8"))
-    return Draft202012Validator(schema)
+
+def _error_sort_key(error: Any) -> Any:
+    return error.path
 
 
 def validate_schema(schema_path: str, payload: Any) -> None:
     validator = load_json_schema(schema_path)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        msg = "; ".join(e.message for e in errors[:5])
-        raise AssertionError(f"Schema validation failed for {schema_path}: {msg}")
+    it = validator.iter_errors(payload)
+    first = next(it, None)
+    if first is None:
+        return
+
+    errors = sorted([first, *it], key=_error_sort_key)
+    msg = "; ".join(e.message for e in errors[:5])
+    raise AssertionError(f"Schema validation failed for {schema_path}: {msg}")
@@ -3,27 +3,46 @@ from __future__ import annotations
 import json
 import os
 import time
-from dataclasses import dataclass
-from typing import Any, Protocol
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Protocol
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from regression.auth import load_auth_config_from_env
 
 
+# Process-wide connection pool: every adapter (one per load_sut_adapter() call) mounts this
+# transport on its own Session, so per-metric GETs pay the TCP+TLS handshake once per host
+# while cookies and other session state stay per adapter.
+_SUT_HTTP_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+
+
 class SutAdapter(Protocol):
     def get_metric(self, metric: str) -> Any:
         """Return the current value for a metric key (e.g., 'device.model')."""
 
+    def get_metrics(self, metrics: list[str]) -> dict[str, Any]:
+        """Return {metric: value} for several metric keys at once."""
+
 
 @dataclass(frozen=True)
 class DictSutAdapter:
     """Small adapter useful for local testing of the test harness itself."""
 
     metrics: dict[str, Any]
+    _get: Callable[[str], Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Bind the lookup once; get_metric is called in tight per-requirement loops.
+        object.__setattr__(self, "_get", self.metrics.get)
 
     def get_metric(self, metric: str) -> Any:
-        return self.metrics.get(metric)
+        return self._get(metric)
+
+    def get_metrics(self, metrics: list[str]) -> dict[str, Any]:
+        return {str(m): self._get(str(m)) for m in metrics}
 
 
 @dataclass
@@ -40,13 +59,24 @@ class ApiSutAdapter:
     _session: requests.Session | None = None
     _cache: dict[str, Any] | None = None
     _auth = None
+    _cached_headers: dict[str, str] | None = None
+    _value_path_parts: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        # metric_value_path is fixed for the adapter's lifetime; split it once.
+        self._value_path_parts = tuple(self.metric_value_path.split(".")) if self.metric_value_path else ()
 
     def _get_session(self) -> requests.Session:
         if self._session is None:
             self._session = requests.Session()
+            self._session.mount("https://", _SUT_HTTP_ADAPTER)
+            self._session.mount("http://", _SUT_HTTP_ADAPTER)
         return self._session
 
     def _headers(self) -> dict[str, str]:
+        if self._cached_headers is not None:
+            return self._cached_headers
+
         headers: dict[str, str] = {"Accept": "application/json"}
 
         # Back-compat: old SUT_TOKEN env var (Bearer)
@@ -54,7 +84,13 @@ class ApiSutAdapter:
             headers["Authorization"] = f"Bearer {self.token}"
 
         auth = self._get_auth()
-        return auth.apply_headers(headers)
+        headers = auth.apply_headers(headers)
+
+        # Client-credentials tokens rotate on expiry; every other mode yields fixed headers.
+        # requests never mutates the headers kwarg, so the same dict can be reused.
+        if not (auth.mode == "oauth2" and not auth.bearer_token):
+            self._cached_headers = headers
+        return headers
 
     def _get_auth(self):
         if self._auth is None:
@@ -117,19 +153,18 @@ class ApiSutAdapter:
         )
 
     @staticmethod
-    def _extract_by_path(payload: Any, dotted_path: str) -> Any:
+    def _extract_by_path(payload: Any, parts: tuple[str, ...]) -> Any:
         cur: Any = payload
-        for part in dotted_path.split("."):
+        for part in parts:
             if not isinstance(cur, dict):
                 return None
-            if part not in cur:
-                return None
-            cur = cur[part]
+            # A missing key and an explicit null both end the walk with None.
+            cur = cur.get(part)
         return cur
 
     def _extract_metric_value(self, payload: Any) -> Any:
-        if self.metric_value_path:
-            extracted = self._extract_by_path(payload, self.metric_value_path)
+        if self._value_path_parts:
+            extracted = self._extract_by_path(payload, self._value_path_parts)
             if extracted is not None:
                 return extracted
 
@@ -157,6 +192,23 @@ class ApiSutAdapter:
             self._cache = self._fetch_all_metrics()
         return self._cache.get(metric)
 
+    def get_metrics(self, metrics: list[str]) -> dict[str, Any]:
+        """Fetch several metrics, issuing per-metric GETs concurrently in template mode.
+
+        Results keep the order of `metrics`; the first failing request raises, as with get_metric.
+        """
+
+        keys = list(dict.fromkeys(str(m) for m in metrics))
+        if not self.metric_url_template or len(keys) <= 1:
+            return {m: self.get_metric(m) for m in keys}
+
+        # Create the session and resolve auth/headers up front so worker threads don't race
+        # to initialize them.
+        self._get_session()
+        self._headers()
+        with ThreadPoolExecutor(max_workers=min(16, len(keys))) as ex:
+            return dict(zip(keys, ex.map(self.get_metric, keys)))
+
 
 def load_sut_adapter() -> SutAdapter:
     """Entry point used by tests.
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import Any
+
+import jwt
+
+
+class JwtVerifier:
+    """Check the signature and required `exp` claim of HS* test tokens, memoized per token.
+
+    Expiry is deliberately not checked here since it depends on the clock; callers compare
+    claims["exp"] against time.time() themselves. Only accepted tokens are cached: a
+    rejection can be time-dependent (nbf/iat), so the token is checked again next time.
+    The returned claims dict is shared between callers, so treat it as read-only.
+    """
+
+    _MAX_ENTRIES = 1024
+
+    def __init__(self, secret: str, alg: str) -> None:
+        self._secret = secret
+        self._algorithms = [alg]
+        self._claims: dict[str, dict[str, Any]] = {}
+
+    def verify(self, token: str) -> dict[str, Any] | None:
+        claims = self._claims.get(token)
+        if claims is not None:
+            return claims
+
+        try:
+            claims = jwt.decode(
+                token,
+                self._secret,
+                algorithms=self._algorithms,
+                options={"require": ["exp"], "verify_exp": False},
+            )
+        except jwt.InvalidTokenError:
+            return None
+
+        if len(self._claims) >= self._MAX_ENTRIES:
+            self._claims.pop(next(iter(self._claims)), None)
+        self._claims[token] = claims
+        return claims
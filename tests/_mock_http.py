@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import time
+from collections.abc import Mapping
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from regression.json_codec import dumps_bytes
+
+_PHRASES = {s.value: s.phrase for s in HTTPStatus}
+
+
+class QuietHandler(BaseHTTPRequestHandler):
+    """Base request handler for the in-process mock servers used by the tests.
+
+    Responses always carry Content-Length, so the handler speaks HTTP/1.1 and clients can
+    keep the connection alive. Per-request access logging is turned off. Subclasses that set
+    ``send_request_id`` get a fresh random X-Request-Id header on every response.
+    """
+
+    # TCP_NODELAY keeps the small responses from waiting on delayed ACKs on a reused connection.
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    send_request_id = False
+    # (epoch second, formatted Date) shared by every handler; reformatted at most once a second.
+    _date_cache: tuple[int, str] = (0, "")
+
+    def log_request(self, code: int | str = "-", size: int | str = "-") -> None:
+        # Skip the per-request access line; log_error still reports failures.
+        return
+
+    def date_time_string(self, timestamp: float | None = None) -> str:
+        if timestamp is not None:
+            return super().date_time_string(timestamp)
+        now = int(time.time())
+        cached = QuietHandler._date_cache
+        if cached[0] != now:
+            cached = (now, super().date_time_string(now))
+            QuietHandler._date_cache = cached
+        return cached[1]
+
+    def _send_bytes(
+        self,
+        status: int,
+        body: bytes,
+        content_type: str | None = "application/json",
+        extra_headers: Mapping[str, str] | None = None,
+    ) -> None:
+        lines = [
+            f"{self.protocol_version} {status} {_PHRASES[status]}",
+            f"Server: {self.version_string()}",
+            f"Date: {self.date_time_string()}",
+        ]
+        if content_type:
+            lines.append(f"Content-Type: {content_type}")
+        lines.append(f"Content-Length: {len(body)}")
+        if self.send_request_id:
+            lines.append(f"X-Request-Id: {os.urandom(16).hex()}")
+        if extra_headers:
+            lines.extend(f"{k}: {v}" for k, v in extra_headers.items())
+        lines.append("\r\n")
+        # Status line, headers and body go out in a single write.
+        self.wfile.write("\r\n".join(lines).encode("latin-1") + body)
+
+    def _send_json(self, status: int, payload: object, extra_headers: Mapping[str, str] | None = None) -> None:
+        self._send_bytes(status, dumps_bytes(payload, indent=False), extra_headers=extra_headers)
+
+
+class PooledHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer that reuses its handler threads across connections.
+
+    A new connection goes to an idle worker when there is one and only otherwise starts a
+    thread, so a kept-alive connection never waits behind a busy worker. Workers are daemon
+    threads and exit on server_close().
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._jobs: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._idle = 0
+        self._workers = 0
+
+    def process_request(self, request, client_address) -> None:
+        with self._lock:
+            spawn = self._idle == 0
+            if spawn:
+                self._workers += 1
+            else:
+                self._idle -= 1
+        if spawn:
+            threading.Thread(target=self._work, daemon=True).start()
+        self._jobs.put((request, client_address))
+
+    def _work(self) -> None:
+        while (job := self._jobs.get()) is not None:
+            self.process_request_thread(*job)
+            with self._lock:
+                self._idle += 1
+
+    def server_close(self) -> None:
+        super().server_close()
+        with self._lock:
+            workers = self._workers
+        for _ in range(workers):
+            self._jobs.put(None)
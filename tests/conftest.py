@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import os
+import stat
 import time
+from datetime import datetime, timezone
 from pathlib import Path
 import shutil
 
@@ -15,6 +17,9 @@ _TEST_COUNTS = {
     "xpassed": 0,
     "error": 0,
 }
+# The run report lists only the first 50 failures; keep a little headroom and stop there
+# so a run with thousands of failures doesn't grow this for the whole session.
+_FAILED_NODEIDS_MAX = 256
 _FAILED_NODEIDS: list[str] = []
 
 
@@ -42,7 +47,7 @@ def pytest_runtest_logreport(report):  # noqa: ANN001
         else:
             _TEST_COUNTS["failed"] += 1
             nodeid = getattr(report, "nodeid", None)
-            if isinstance(nodeid, str) and nodeid:
+            if isinstance(nodeid, str) and nodeid and len(_FAILED_NODEIDS) < _FAILED_NODEIDS_MAX:
                 _FAILED_NODEIDS.append(nodeid)
         return
 
@@ -82,9 +87,10 @@ def pytest_sessionfinish(session, exitstatus):  # noqa: ANN001
         try:
             src = Path.cwd() / "README.md"
             dst = Path(report_dir) / "README.md"
-            if src.exists() and src.is_file():
+            # One stat instead of exists()/is_file(); copyfile skips copy2's metadata pass.
+            if stat.S_ISREG(os.stat(src).st_mode):
                 dst.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src, dst)
+                shutil.copyfile(src, dst)
                 write_encrypted_copy_if_configured(str(dst))
         except Exception:
             # Never break test runs for report bundling
@@ -114,7 +120,10 @@ def pytest_sessionfinish(session, exitstatus):  # noqa: ANN001
         if _RUN_START_TIME is not None:
             duration_s = max(0.0, time.time() - _RUN_START_TIME)
 
-        rr = write_run_report(
+        # One timestamp for both consolidated reports so their generated_at values agree.
+        generated_at = datetime.now(timezone.utc).isoformat()
+
+        run_result = write_run_report(
             run_report_path,
             exitstatus=int(exitstatus),
             duration_s=duration_s,
@@ -122,8 +131,9 @@ def pytest_sessionfinish(session, exitstatus):  # noqa: ANN001
             failed_nodeids=list(_FAILED_NODEIDS),
             api_report_path=api_out,
             evidence_path=evidence_out,
+            generated_at=generated_at,
         )
-        write_encrypted_copy_if_configured(rr)
+        write_encrypted_copy_if_configured(run_result.path)
 
         # Optional: also produce a static HTML dashboard next to the JSON artifacts.
         # Enabled when REPORT_DIR is set (recommended) OR when RUN_REPORT_HTML_PATH is set.
@@ -137,9 +147,14 @@ def pytest_sessionfinish(session, exitstatus):  # noqa: ANN001
 
             out_html = write_html_report(
                 html_path,
-                run_report_path=rr,
+                run_report_path=run_result.path,
                 api_report_path=api_out,
                 evidence_path=evidence_out,
+                generated_at=generated_at,
+                # Reuse what the run report already parsed instead of re-reading the files.
+                run_report=run_result.report,
+                api_report=run_result.api_report if isinstance(run_result.api_report, dict) else None,
+                evidence=run_result.evidence if isinstance(run_result.evidence, dict) else None,
             )
             write_encrypted_copy_if_configured(out_html)
 
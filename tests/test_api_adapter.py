@@ -1,31 +1,31 @@
 from __future__ import annotations
 
-import json
 import threading
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from urllib.parse import unquote
 
 import pytest
 
+from _mock_http import PooledHTTPServer, QuietHandler
 from regression.sut import load_sut_adapter
 
 
-class _Handler(BaseHTTPRequestHandler):
+class _Handler(QuietHandler):
     metrics: dict[str, object] = {
         "device.model": "eyeSight-DEMO",
         "coverage.vendor_model_count": 7700,
     }
 
-    def _send_json(self, status: int, payload: object) -> None:
-        body = json.dumps(payload).encode("utf-8")
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(body)))
-        self.end_headers()
-        self.wfile.write(body)
-
     def do_GET(self) -> None:  # noqa: N802
-        path = (self.path or "").split("?", 1)[0]
+        path = (self.path or "").partition("?")[0]
+
+        if path == "/metrics/session.cookie":
+            # Echo the client's cookie, then hand it one, so tests can see what a client carries.
+            self._send_json(
+                200,
+                {"value": self.headers.get("Cookie")},
+                extra_headers={"Set-Cookie": "sid=demo-session; Path=/"},
+            )
+            return
 
         if path.startswith("/metrics/"):
             metric = unquote(path[len("/metrics/") :])
@@ -38,18 +38,19 @@ class _Handler(BaseHTTPRequestHandler):
         self._send_json(404, {"error": "not_found"})
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def mock_api_base_url() -> str:
-    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server = PooledHTTPServer(("127.0.0.1", 0), _Handler)
     host, port = server.server_address
 
-    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
     t.start()
 
     try:
         yield f"http://{host}:{port}"
     finally:
         server.shutdown()
+        server.server_close()
 
 
 def test_api_per_metric_template(monkeypatch: pytest.MonkeyPatch, mock_api_base_url: str) -> None:
@@ -61,3 +62,29 @@ def test_api_per_metric_template(monkeypatch: pytest.MonkeyPatch, mock_api_base_
 
     assert sut.get_metric("device.model") == "eyeSight-DEMO"
     assert sut.get_metric("coverage.vendor_model_count") == 7700
+
+
+def test_api_get_metrics_batches_template_requests(monkeypatch: pytest.MonkeyPatch, mock_api_base_url: str) -> None:
+    monkeypatch.setenv("SUT_MODE", "api")
+    monkeypatch.setenv("SUT_BASE_URL", mock_api_base_url)
+    monkeypatch.setenv("SUT_METRIC_URL_TEMPLATE", "{base_url}/metrics/{metric}")
+
+    sut = load_sut_adapter()
+
+    assert sut.get_metrics(["coverage.vendor_model_count", "device.model", "device.model"]) == {
+        "coverage.vendor_model_count": 7700,
+        "device.model": "eyeSight-DEMO",
+    }
+
+
+def test_api_adapters_do_not_share_cookies(monkeypatch: pytest.MonkeyPatch, mock_api_base_url: str) -> None:
+    monkeypatch.setenv("SUT_MODE", "api")
+    monkeypatch.setenv("SUT_BASE_URL", mock_api_base_url)
+    monkeypatch.setenv("SUT_METRIC_URL_TEMPLATE", "{base_url}/metrics/{metric}")
+
+    first = load_sut_adapter()
+    assert first.get_metric("session.cookie") is None
+    assert first.get_metric("session.cookie") == "sid=demo-session"
+
+    # A fresh adapter must not inherit the first one's cookie jar.
+    assert load_sut_adapter().get_metric("session.cookie") is None
@@ -1,93 +1,105 @@
 from __future__ import annotations
 
-import json
 import threading
 import time
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from functools import lru_cache
 
 import jwt
 import pytest
 
+from _jwt_cache import JwtVerifier
+from _mock_http import PooledHTTPServer, QuietHandler
 from regression.api_contract import run_contract_checks
 
 
 _SECRET = "demo-jwt-secret-32bytes-minimum-OK"
 _ALG = "HS256"
+_VERIFIER = JwtVerifier(_SECRET, _ALG)
 
 
-def _make_token(*, roles: list[str], perms: list[str], exp: float) -> str:
+def _make_token(*, roles: list[str], perms: list[str], iat: float, exp: float) -> str:
     payload = {
         "sub": "demo-user",
         "roles": roles,
         "perms": perms,
-        "iat": int(time.time()),
+        "iat": int(iat),
         "exp": int(exp),
         "iss": "demo-issuer",
     }
     return jwt.encode(payload, _SECRET, algorithm=_ALG)
 
 
-class _Handler(BaseHTTPRequestHandler):
-    def _send_json(self, status: int, payload: object) -> None:
-        b = json.dumps(payload).encode("utf-8")
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(b)))
-        self.end_headers()
-        self.wfile.write(b)
+@lru_cache(maxsize=256)
+def _perm_set(token: str) -> frozenset[str]:
+    # Only called for tokens _VERIFIER accepted; parsed once per token.
+    perms = (_VERIFIER.verify(token) or {}).get("perms") or []
+    if not isinstance(perms, list):
+        return frozenset()
+    return frozenset(p for p in perms if isinstance(p, str))
 
+
+# Static response bodies, encoded once at import.
+_BODY_MISSING_BEARER = b'{"error": "unauthorized", "message": "missing_bearer"}'
+_BODY_INVALID_TOKEN = b'{"error": "invalid_token"}'
+_BODY_TOKEN_EXPIRED = b'{"error": "token_expired"}'
+_BODY_MISSING_ROLE_ADMIN = b'{"error": "forbidden", "message": "missing_role: admin"}'
+_BODY_MISSING_PERM_BASIC = b'{"error": "forbidden", "message": "missing_permission: metrics:read:basic"}'
+_BODY_MODEL = b'{"value": "eyeSight-DEMO"}'
+_BODY_MISSING_PERM_COVERAGE = b'{"error": "forbidden", "message": "missing_permission: metrics:read:coverage"}'
+_BODY_COVERAGE = b'{"value": 42}'
+
+
+class _Handler(QuietHandler):
     def _require_token(self) -> tuple[dict, str] | None:
-        auth = (self.headers.get("Authorization") or "").strip()
-        if not auth.startswith("Bearer "):
-            self._send_json(401, {"error": "unauthorized", "message": "missing_bearer"})
+        scheme, sep, token = (self.headers.get("Authorization") or "").strip().partition(" ")
+        if scheme != "Bearer" or not sep:
+            self._send_bytes(401, _BODY_MISSING_BEARER)
             return None
 
-        token = auth[len("Bearer ") :].strip()
-        try:
-            claims = jwt.decode(token, _SECRET, algorithms=[_ALG], options={"require": ["exp"]})
-            return claims, token
-        except jwt.ExpiredSignatureError:
-            self._send_json(401, {"error": "token_expired"})
+        # The header was already stripped, so only extra separator spaces can remain.
+        token = token.lstrip()
+        claims = _VERIFIER.verify(token)
+        if claims is None:
+            self._send_bytes(401, _BODY_INVALID_TOKEN)
             return None
-        except Exception:
-            self._send_json(401, {"error": "invalid_token"})
+        if claims["exp"] <= time.time():
+            self._send_bytes(401, _BODY_TOKEN_EXPIRED)
             return None
+        return claims, token
 
     @staticmethod
-    def _has_any_perm(perms: list[str], required: str) -> bool:
+    def _has_any_perm(perms: frozenset[str], required: str) -> bool:
         return required in perms or "metrics:read:*" in perms or "*" in perms
 
     def do_GET(self) -> None:  # noqa: N802
-        path = (self.path or "").split("?", 1)[0]
+        path = (self.path or "").partition("?")[0]
         authz = self._require_token()
         if authz is None:
             return
-        claims, _token = authz
+        claims, token = authz
 
         roles = claims.get("roles") or []
-        perms = claims.get("perms") or []
         if not isinstance(roles, list):
             roles = []
-        if not isinstance(perms, list):
-            perms = []
+        perms = _perm_set(token)
 
         # Role-based access: /admin/* requires admin role
         if path.startswith("/admin/") and "admin" not in roles:
-            self._send_json(403, {"error": "forbidden", "message": "missing_role: admin"})
+            self._send_bytes(403, _BODY_MISSING_ROLE_ADMIN)
             return
 
         if path == "/metrics/device.model" or path == "/admin/metrics/device.model":
             if not self._has_any_perm(perms, "metrics:read:basic"):
-                self._send_json(403, {"error": "forbidden", "message": "missing_permission: metrics:read:basic"})
+                self._send_bytes(403, _BODY_MISSING_PERM_BASIC)
                 return
-            self._send_json(200, {"value": "eyeSight-DEMO"})
+            self._send_bytes(200, _BODY_MODEL)
             return
 
         if path == "/metrics/coverage.vendor_model_count":
             if not self._has_any_perm(perms, "metrics:read:coverage"):
-                self._send_json(403, {"error": "forbidden", "message": "missing_permission: metrics:read:coverage"})
+                self._send_bytes(403, _BODY_MISSING_PERM_COVERAGE)
                 return
-            self._send_json(200, {"value": 42})
+            self._send_bytes(200, _BODY_COVERAGE)
             return
 
         self._send_json(404, {"error": "not_found", "path": path})
@@ -95,24 +107,25 @@ class _Handler(BaseHTTPRequestHandler):
 
 @pytest.fixture()
 def base_url() -> str:
-    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server = PooledHTTPServer(("127.0.0.1", 0), _Handler)
     host, port = server.server_address
 
-    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
     t.start()
 
     try:
         yield f"http://{host}:{port}"
     finally:
         server.shutdown()
+        server.server_close()
 
 
 def test_authz_contract(monkeypatch: pytest.MonkeyPatch, base_url: str) -> None:
     now = time.time()
 
-    viewer_token = _make_token(roles=["viewer"], perms=["metrics:read:basic"], exp=now + 120)
-    admin_token = _make_token(roles=["admin"], perms=["metrics:read:*"], exp=now + 120)
-    expired_token = _make_token(roles=["viewer"], perms=["metrics:read:basic"], exp=now - 120)
+    viewer_token = _make_token(roles=["viewer"], perms=["metrics:read:basic"], iat=now, exp=now + 120)
+    admin_token = _make_token(roles=["admin"], perms=["metrics:read:*"], iat=now, exp=now + 120)
+    expired_token = _make_token(roles=["viewer"], perms=["metrics:read:basic"], iat=now, exp=now - 120)
 
     invalid_token = jwt.encode(
         {"sub": "demo-user", "exp": int(now + 120)},
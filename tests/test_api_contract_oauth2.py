@@ -1,71 +1,82 @@
 from __future__ import annotations
 
 import base64
-import json
 import threading
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from urllib.parse import parse_qs
 
 import pytest
 
+from _mock_http import PooledHTTPServer, QuietHandler
 from regression.api_contract import run_contract_checks
 
 
-class _Handler(BaseHTTPRequestHandler):
-    def _send_json(self, status: int, payload: object) -> None:
-        b = json.dumps(payload).encode("utf-8")
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(b)))
-        self.end_headers()
-        self.wfile.write(b)
+_EXPECTED_BASIC = "Basic " + base64.b64encode(b"client:secret").decode("ascii")
+_EXPECTED_BEARER = "Bearer demo-token"
 
+# Static response bodies, encoded once at import.
+_BODY_NOT_FOUND = b'{"error": "not_found"}'
+_BODY_INVALID_CLIENT = b'{"error": "invalid_client"}'
+_BODY_UNSUPPORTED_GRANT_TYPE = b'{"error": "unsupported_grant_type"}'
+_BODY_TOKEN = b'{"access_token": "demo-token", "token_type": "Bearer", "expires_in": 3600}'
+_BODY_UNAUTHORIZED = b'{"error": "unauthorized"}'
+_BODY_MODEL = b'{"value": "eyeSight-DEMO"}'
+
+
+def _grant_type(body: bytes) -> bytes | None:
+    # Only grant_type matters here, so skip building the full parse_qs mapping.
+    for pair in body.split(b"&"):
+        k, _, v = pair.partition(b"=")
+        if k == b"grant_type":
+            return v
+    return None
+
+
+class _Handler(QuietHandler):
     def do_POST(self) -> None:  # noqa: N802
+        # Consume the form body up front so early rejections leave the connection reusable.
+        body = self.rfile.read(int(self.headers.get("Content-Length") or "0"))
+
         # OAuth2 token endpoint
-        path = (self.path or "").split("?", 1)[0]
+        path = (self.path or "").partition("?")[0]
         if path != "/oauth/token":
-            self._send_json(404, {"error": "not_found"})
+            self._send_bytes(404, _BODY_NOT_FOUND)
             return
 
-        expected = "Basic " + base64.b64encode(b"client:secret").decode("ascii")
-        if (self.headers.get("Authorization") or "") != expected:
-            self._send_json(401, {"error": "invalid_client"})
+        if (self.headers.get("Authorization") or "") != _EXPECTED_BASIC:
+            self._send_bytes(401, _BODY_INVALID_CLIENT)
             return
 
-        length = int(self.headers.get("Content-Length") or "0")
-        body = self.rfile.read(length).decode("utf-8")
-        form = parse_qs(body)
-        if (form.get("grant_type") or [""])[0] != "client_credentials":
-            self._send_json(400, {"error": "unsupported_grant_type"})
+        if _grant_type(body) != b"client_credentials":
+            self._send_bytes(400, _BODY_UNSUPPORTED_GRANT_TYPE)
             return
 
-        self._send_json(200, {"access_token": "demo-token", "token_type": "Bearer", "expires_in": 3600})
+        self._send_bytes(200, _BODY_TOKEN)
 
     def do_GET(self) -> None:  # noqa: N802
-        path = (self.path or "").split("?", 1)[0]
+        path = (self.path or "").partition("?")[0]
         if path != "/metrics/device.model":
-            self._send_json(404, {"error": "not_found"})
+            self._send_bytes(404, _BODY_NOT_FOUND)
             return
 
-        if self.headers.get("Authorization") != "Bearer demo-token":
-            self._send_json(401, {"error": "unauthorized"})
+        if self.headers.get("Authorization") != _EXPECTED_BEARER:
+            self._send_bytes(401, _BODY_UNAUTHORIZED)
             return
 
-        self._send_json(200, {"value": "eyeSight-DEMO"})
+        self._send_bytes(200, _BODY_MODEL)
 
 
 @pytest.fixture()
 def base_url() -> str:
-    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server = PooledHTTPServer(("127.0.0.1", 0), _Handler)
     host, port = server.server_address
 
-    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
     t.start()
 
     try:
         yield f"http://{host}:{port}"
     finally:
         server.shutdown()
+        server.server_close()
 
 
 def test_contract_runner_oauth2_overrides(monkeypatch: pytest.MonkeyPatch, base_url: str) -> None:
@@ -2,41 +2,41 @@ from __future__ import annotations
 
 import json
 import threading
-import uuid
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from urllib.parse import parse_qs
 
 import pytest
 
+from _mock_http import PooledHTTPServer, QuietHandler
 from regression.api_contract import run_contract_checks
 
 
+_EXPECTED_BEARER = "Bearer demo-rest-token"
+_JSON_CONTENT_TYPE = "application/json"
+
+# Static response bodies, encoded once at import.
+_BODY_UNAUTHORIZED = b'{"error": "unauthorized"}'
+_BODY_NOT_FOUND = b'{"error": "not_found"}'
+_BODY_INVALID_JSON = b'{"error": "invalid_json"}'
+_BODY_UNSUPPORTED_MEDIA_TYPE = b'{"error": "unsupported_media_type"}'
+_BODY_METHOD_NOT_ALLOWED = b'{"error": "method_not_allowed"}'
+
+
 class _State:
     created_count = 0
 
 
-class _Handler(BaseHTTPRequestHandler):
-    def _send_json(self, status: int, payload: object, *, extra_headers: dict[str, str] | None = None) -> None:
-        b = json.dumps(payload).encode("utf-8")
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(b)))
-        self.send_header("X-Request-Id", str(uuid.uuid4()))
-        if extra_headers:
-            for k, v in extra_headers.items():
-                self.send_header(k, v)
-        self.end_headers()
-        self.wfile.write(b)
+class _Handler(QuietHandler):
+    send_request_id = True
 
     def _require_auth(self) -> bool:
         auth = (self.headers.get("Authorization") or "").strip()
-        return auth == "Bearer demo-rest-token"
+        return auth == _EXPECTED_BEARER
 
     def do_GET(self) -> None:  # noqa: N802
         path, _, query = (self.path or "").partition("?")
 
         if path.startswith("/items") and not self._require_auth():
-            self._send_json(401, {"error": "unauthorized"})
+            self._send_bytes(401, _BODY_UNAUTHORIZED)
             return
 
         if path == "/items":
@@ -63,36 +63,39 @@ class _Handler(BaseHTTPRequestHandler):
 
         if path.startswith("/items/"):
             # Not found for demo
-            self._send_json(404, {"error": "not_found"})
+            self._send_bytes(404, _BODY_NOT_FOUND)
             return
 
-        self._send_json(404, {"error": "not_found"})
+        self._send_bytes(404, _BODY_NOT_FOUND)
+
+    def _read_body(self) -> bytes:
+        # Consumed before any early return so the kept-alive connection stays in sync.
+        return self.rfile.read(int(self.headers.get("Content-Length") or "0"))
 
     def do_POST(self) -> None:  # noqa: N802
-        if (self.path or "").split("?", 1)[0] != "/items":
-            self._send_json(404, {"error": "not_found"})
+        raw = self._read_body()
+        if (self.path or "").partition("?")[0] != "/items":
+            self._send_bytes(404, _BODY_NOT_FOUND)
             return
 
         if not self._require_auth():
-            self._send_json(401, {"error": "unauthorized"})
+            self._send_bytes(401, _BODY_UNAUTHORIZED)
             return
 
         # Trigger a bad-json path if header present (simplifies testing 400).
         if (self.headers.get("X-Bad-Json") or "").strip().lower() in ("1", "true", "yes"):
-            self._send_json(400, {"error": "invalid_json"})
+            self._send_bytes(400, _BODY_INVALID_JSON)
             return
 
         ctype = (self.headers.get("Content-Type") or "").lower()
-        if "application/json" not in ctype:
-            self._send_json(415, {"error": "unsupported_media_type"})
+        if _JSON_CONTENT_TYPE not in ctype:
+            self._send_bytes(415, _BODY_UNSUPPORTED_MEDIA_TYPE)
             return
 
-        length = int(self.headers.get("Content-Length") or "0")
-        raw = self.rfile.read(length)
         try:
             _ = json.loads(raw.decode("utf-8") or "{}")
         except Exception:
-            self._send_json(400, {"error": "invalid_json"})
+            self._send_bytes(400, _BODY_INVALID_JSON)
             return
 
         _State.created_count += 1
@@ -100,13 +103,14 @@ class _Handler(BaseHTTPRequestHandler):
         self._send_json(201, {"value": f"created-{_State.created_count}"})
 
     def do_PATCH(self) -> None:  # noqa: N802
-        if (self.path or "").split("?", 1)[0] == "/items":
+        self._read_body()
+        if (self.path or "").partition("?")[0] == "/items":
             if not self._require_auth():
-                self._send_json(401, {"error": "unauthorized"})
+                self._send_bytes(401, _BODY_UNAUTHORIZED)
                 return
-            self._send_json(405, {"error": "method_not_allowed"})
+            self._send_bytes(405, _BODY_METHOD_NOT_ALLOWED)
             return
-        self._send_json(404, {"error": "not_found"})
+        self._send_bytes(404, _BODY_NOT_FOUND)
 
     def _base_url(self) -> str:
         host = self.headers.get("Host") or "127.0.0.1"
@@ -117,16 +121,17 @@ class _Handler(BaseHTTPRequestHandler):
 def base_url() -> str:
     _State.created_count = 0
 
-    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server = PooledHTTPServer(("127.0.0.1", 0), _Handler)
     host, port = server.server_address
 
-    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
     t.start()
 
     try:
         yield f"http://{host}:{port}"
     finally:
         server.shutdown()
+        server.server_close()
 
 
 def test_rest_concepts_contract(monkeypatch: pytest.MonkeyPatch, base_url: str) -> None:
@@ -1,33 +1,40 @@
 from __future__ import annotations
 
-import json
 import threading
 import time
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from functools import lru_cache
 
 import jwt
 import pytest
 
+from _jwt_cache import JwtVerifier
+from _mock_http import PooledHTTPServer, QuietHandler
 from regression.api_contract import run_contract_checks
 
 
 _SECRET = "demo-scope-jwt-secret-32bytes-minimum-OK"
 _ALG = "HS256"
+_VERIFIER = JwtVerifier(_SECRET, _ALG)
 
 
-def _make_token(*, scope: str, exp: float) -> str:
+def _make_token(*, scope: str, iat: float, exp: float) -> str:
     payload = {
         "sub": "demo-user",
         "scope": scope,
-        "iat": int(time.time()),
+        "iat": int(iat),
         "exp": int(exp),
         "iss": "demo-issuer",
     }
     return jwt.encode(payload, _SECRET, algorithm=_ALG)
 
 
-def _has_scope(scope_str: str, required: str) -> bool:
-    scopes = {s for s in (scope_str or "").split() if s}
+@lru_cache(maxsize=64)
+def _scope_set(scope_str: str) -> frozenset[str]:
+    # split() never yields empty strings; parsed once per distinct scope claim.
+    return frozenset(scope_str.split())
+
+
+def _has_scope(scopes: frozenset[str], required: str) -> bool:
     if required in scopes:
         return True
     # Simple wildcard support for the demo
@@ -35,56 +42,60 @@ def _has_scope(scope_str: str, required: str) -> bool:
     return any(s.endswith(".*") and s.startswith(prefix) for s in scopes) or ("*" in scopes)
 
 
-class _Handler(BaseHTTPRequestHandler):
-    def _send_json(self, status: int, payload: object) -> None:
-        b = json.dumps(payload).encode("utf-8")
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(b)))
-        self.end_headers()
-        self.wfile.write(b)
+# Static response bodies, encoded once at import.
+_BODY_MISSING_BEARER = b'{"error": "unauthorized", "message": "missing_bearer"}'
+_BODY_INVALID_TOKEN = b'{"error": "invalid_token"}'
+_BODY_TOKEN_EXPIRED = b'{"error": "token_expired"}'
+_BODY_MISSING_SCOPE_ADMIN = b'{"error": "insufficient_scope", "required": "admin"}'
+_BODY_MISSING_SCOPE_BASIC = b'{"error": "insufficient_scope", "required": "metrics.read.basic"}'
+_BODY_MODEL = b'{"value": "eyeSight-DEMO"}'
+_BODY_MISSING_SCOPE_COVERAGE = b'{"error": "insufficient_scope", "required": "metrics.read.coverage"}'
+_BODY_COVERAGE = b'{"value": 42}'
 
+
+class _Handler(QuietHandler):
     def _require_token(self) -> dict | None:
-        auth = (self.headers.get("Authorization") or "").strip()
-        if not auth.startswith("Bearer "):
-            self._send_json(401, {"error": "unauthorized", "message": "missing_bearer"})
+        scheme, sep, token = (self.headers.get("Authorization") or "").strip().partition(" ")
+        if scheme != "Bearer" or not sep:
+            self._send_bytes(401, _BODY_MISSING_BEARER)
             return None
 
-        token = auth[len("Bearer ") :].strip()
-        try:
-            return jwt.decode(token, _SECRET, algorithms=[_ALG], options={"require": ["exp"]})
-        except jwt.ExpiredSignatureError:
-            self._send_json(401, {"error": "token_expired"})
+        # The header was already stripped, so only extra separator spaces can remain.
+        token = token.lstrip()
+        claims = _VERIFIER.verify(token)
+        if claims is None:
+            self._send_bytes(401, _BODY_INVALID_TOKEN)
             return None
-        except Exception:
-            self._send_json(401, {"error": "invalid_token"})
+        if claims["exp"] <= time.time():
+            self._send_bytes(401, _BODY_TOKEN_EXPIRED)
             return None
+        return claims
 
     def do_GET(self) -> None:  # noqa: N802
-        path = (self.path or "").split("?", 1)[0]
+        path = (self.path or "").partition("?")[0]
         claims = self._require_token()
         if claims is None:
             return
 
-        scope = str(claims.get("scope") or "")
+        scopes = _scope_set(str(claims.get("scope") or ""))
 
         # Admin endpoints require an admin scope
-        if path.startswith("/admin/") and not _has_scope(scope, "admin"):
-            self._send_json(403, {"error": "insufficient_scope", "required": "admin"})
+        if path.startswith("/admin/") and not _has_scope(scopes, "admin"):
+            self._send_bytes(403, _BODY_MISSING_SCOPE_ADMIN)
             return
 
         if path == "/metrics/device.model" or path == "/admin/metrics/device.model":
-            if not _has_scope(scope, "metrics.read.basic"):
-                self._send_json(403, {"error": "insufficient_scope", "required": "metrics.read.basic"})
+            if not _has_scope(scopes, "metrics.read.basic"):
+                self._send_bytes(403, _BODY_MISSING_SCOPE_BASIC)
                 return
-            self._send_json(200, {"value": "eyeSight-DEMO"})
+            self._send_bytes(200, _BODY_MODEL)
             return
 
         if path == "/metrics/coverage.vendor_model_count":
-            if not _has_scope(scope, "metrics.read.coverage"):
-                self._send_json(403, {"error": "insufficient_scope", "required": "metrics.read.coverage"})
+            if not _has_scope(scopes, "metrics.read.coverage"):
+                self._send_bytes(403, _BODY_MISSING_SCOPE_COVERAGE)
                 return
-            self._send_json(200, {"value": 42})
+            self._send_bytes(200, _BODY_COVERAGE)
             return
 
         self._send_json(404, {"error": "not_found", "path": path})
@@ -92,24 +103,25 @@ class _Handler(BaseHTTPRequestHandler):
 
 @pytest.fixture()
 def base_url() -> str:
-    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server = PooledHTTPServer(("127.0.0.1", 0), _Handler)
     host, port = server.server_address
 
-    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
     t.start()
 
     try:
         yield f"http://{host}:{port}"
     finally:
         server.shutdown()
+        server.server_close()
 
 
 def test_scope_authz_contract(monkeypatch: pytest.MonkeyPatch, base_url: str) -> None:
     now = time.time()
 
-    viewer_token = _make_token(scope="metrics.read.basic", exp=now + 120)
-    admin_token = _make_token(scope="metrics.read.* admin", exp=now + 120)
-    expired_token = _make_token(scope="metrics.read.basic", exp=now - 120)
+    viewer_token = _make_token(scope="metrics.read.basic", iat=now, exp=now + 120)
+    admin_token = _make_token(scope="metrics.read.* admin", iat=now, exp=now + 120)
+    expired_token = _make_token(scope="metrics.read.basic", iat=now, exp=now - 120)
 
     invalid_token = jwt.encode(
         {"sub": "demo-user", "scope": "metrics.read.basic", "exp": int(now + 120)},
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from regression.api_reporting import ApiCall, summarize_calls
+
+
+def _call(url: str, elapsed_ms: float, *, status_code: int | None = 200, error: str | None = None) -> ApiCall:
+    return ApiCall(
+        method="GET",
+        url=url,
+        status_code=status_code,
+        ok=error is None and status_code is not None and status_code < 400,
+        elapsed_ms=elapsed_ms,
+        error=error,
+    )
+
+
+def test_summarize_calls_groups_latency_per_redacted_url() -> None:
+    calls = [
+        _call("http://example.local/metrics/a?api_key=k1", 5.0),
+        _call("http://example.local/metrics/a?api_key=k2", 1.0),
+        _call("http://example.local/metrics/a?api_key=k3", 3.0),
+        _call("http://example.local/metrics/b", 10.0, status_code=500),
+    ]
+
+    summary = summarize_calls(calls)
+    assert summary["total_calls"] == 4
+    assert summary["total_errors"] == 1
+
+    endpoints = {ep["url"]: ep for ep in summary["endpoints"]}
+    a = endpoints["http://example.local/metrics/a?api_key=REDACTED"]
+    assert a["count"] == 3
+    assert a["p50_ms"] == 3.0
+    assert a["p95_ms"] == 5.0
+    assert a["max_ms"] == 5.0
+
+    b = endpoints["http://example.local/metrics/b"]
+    assert b["error_count"] == 1
+    assert b["status_codes"] == {"500": 1}
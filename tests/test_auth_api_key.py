@@ -1,55 +1,55 @@
 from __future__ import annotations
 
-import json
 import threading
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from urllib.parse import unquote
 
 import pytest
 import requests
 
+from _mock_http import PooledHTTPServer, QuietHandler
 from regression.sut import load_sut_adapter
 
 
-class _Handler(BaseHTTPRequestHandler):
-    def _send_json(self, status: int, payload: object) -> None:
-        b = json.dumps(payload).encode("utf-8")
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(b)))
-        self.end_headers()
-        self.wfile.write(b)
+_EXPECTED_API_KEY = "demo-key"
 
+# Static response bodies, encoded once at import.
+_BODY_UNAUTHORIZED = b'{"error": "unauthorized"}'
+_BODY_MODEL = b'{"value": "eyeSight-DEMO"}'
+_BODY_UNKNOWN_METRIC = b'{"error": "unknown_metric"}'
+_BODY_NOT_FOUND = b'{"error": "not_found"}'
+
+
+class _Handler(QuietHandler):
     def do_GET(self) -> None:  # noqa: N802
-        api_key = self.headers.get("X-API-Key")
-        if api_key != "demo-key":
-            self._send_json(401, {"error": "unauthorized"})
+        if self.headers.get("X-API-Key") != _EXPECTED_API_KEY:
+            self._send_bytes(401, _BODY_UNAUTHORIZED)
             return
 
-        path = (self.path or "").split("?", 1)[0]
+        path = (self.path or "").partition("?")[0]
         if path.startswith("/metrics/"):
             metric = unquote(path[len("/metrics/") :])
             if metric == "device.model":
-                self._send_json(200, {"value": "eyeSight-DEMO"})
+                self._send_bytes(200, _BODY_MODEL)
                 return
-            self._send_json(404, {"error": "unknown_metric"})
+            self._send_bytes(404, _BODY_UNKNOWN_METRIC)
             return
 
-        self._send_json(404, {"error": "not_found"})
+        self._send_bytes(404, _BODY_NOT_FOUND)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def base_url() -> str:
-    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server = PooledHTTPServer(("127.0.0.1", 0), _Handler)
     host, port = server.server_address
 
-    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
     t.start()
 
     try:
         yield f"http://{host}:{port}"
     finally:
         server.shutdown()
+        server.server_close()
 
 
 def test_api_key_positive(monkeypatch: pytest.MonkeyPatch, base_url: str) -> None:
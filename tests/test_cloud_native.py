@@ -1,88 +1,93 @@
 from __future__ import annotations
 
-import json
 import threading
 import time
-import uuid
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from collections.abc import Iterator
 
 import pytest
 import requests
 
+from _mock_http import PooledHTTPServer, QuietHandler
 from regression.api_contract import run_contract_checks
 
 
+# Static response bodies, encoded once at import.
+_BODY_OK = b'{"ok": true}'
+_BODY_NOT_OK = b'{"ok": false}'
+_BODY_VERSION = b'{"version": "1.2.3", "commit": "abc123"}'
+_BODY_MODEL = b'{"value": "eyeSight-DEMO"}'
+_BODY_RATE_LIMITED = b'{"error":"rate_limited"}'
+
+
 class _State:
     ready = True
     rate_limit_next = False
 
 
-class _Handler(BaseHTTPRequestHandler):
-    def _send_json(self, status: int, payload: object) -> None:
-        b = json.dumps(payload).encode("utf-8")
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(b)))
-        self.send_header("X-Request-Id", str(uuid.uuid4()))
-        self.end_headers()
-        self.wfile.write(b)
+class _Handler(QuietHandler):
+    send_request_id = True
 
     def do_GET(self) -> None:  # noqa: N802
-        path = (self.path or "").split("?", 1)[0]
+        path = (self.path or "").partition("?")[0]
 
         if path == "/healthz":
-            self._send_json(200, {"ok": True})
+            self._send_bytes(200, _BODY_OK)
             return
 
         if path == "/livez":
-            self._send_json(200, {"ok": True})
+            self._send_bytes(200, _BODY_OK)
             return
 
         if path == "/readyz":
             if not _State.ready:
-                self._send_json(503, {"ok": False})
+                self._send_bytes(503, _BODY_NOT_OK)
                 return
-            self._send_json(200, {"ok": True})
+            self._send_bytes(200, _BODY_OK)
             return
 
         if path == "/version":
-            self._send_json(200, {"version": "1.2.3", "commit": "abc123"})
+            self._send_bytes(200, _BODY_VERSION)
             return
 
         if path == "/metrics/device.model":
             if _State.rate_limit_next:
                 _State.rate_limit_next = False
-                self.send_response(429)
-                self.send_header("Content-Type", "application/json")
-                self.send_header("Retry-After", "1")
-                self.send_header("X-Request-Id", str(uuid.uuid4()))
-                b = b'{"error":"rate_limited"}'
-                self.send_header("Content-Length", str(len(b)))
-                self.end_headers()
-                self.wfile.write(b)
+                self._send_bytes(429, _BODY_RATE_LIMITED, extra_headers={"Retry-After": "1"})
                 return
 
-            self._send_json(200, {"value": "eyeSight-DEMO"})
+            self._send_bytes(200, _BODY_MODEL)
             return
 
         self._send_json(404, {"error": "not_found", "path": path})
 
 
-@pytest.fixture()
-def base_url() -> str:
+@pytest.fixture(autouse=True)
+def _reset_state() -> None:
+    # The server is shared across the module; its toggles are reset per test.
     _State.ready = True
     _State.rate_limit_next = False
 
-    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+
+@pytest.fixture(scope="module")
+def base_url() -> str:
+    server = PooledHTTPServer(("127.0.0.1", 0), _Handler)
     host, port = server.server_address
 
-    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
     t.start()
 
     try:
         yield f"http://{host}:{port}"
     finally:
         server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(scope="module")
+def session() -> Iterator[requests.Session]:
+    # One pooled session per module, so sequential requests reuse a kept-alive connection.
+    with requests.Session() as s:
+        yield s
 
 
 def test_cloud_native_contract_runner(monkeypatch: pytest.MonkeyPatch, base_url: str) -> None:
@@ -91,19 +96,19 @@ def test_cloud_native_contract_runner(monkeypatch: pytest.MonkeyPatch, base_url:
     assert [r.status_code for r in results] == [200, 200, 200, 200]
 
 
-def test_readiness_transition(base_url: str) -> None:
+def test_readiness_transition(base_url: str, session: requests.Session) -> None:
     _State.ready = False
-    r1 = requests.get(f"{base_url}/readyz", timeout=5)
+    r1 = session.get(f"{base_url}/readyz", timeout=5)
     assert r1.status_code == 503
 
     _State.ready = True
-    r2 = requests.get(f"{base_url}/readyz", timeout=5)
+    r2 = session.get(f"{base_url}/readyz", timeout=5)
     assert r2.status_code == 200
 
 
-def test_request_id_present_and_unique(base_url: str) -> None:
-    r1 = requests.get(f"{base_url}/healthz", timeout=5)
-    r2 = requests.get(f"{base_url}/healthz", timeout=5)
+def test_request_id_present_and_unique(base_url: str, session: requests.Session) -> None:
+    r1 = session.get(f"{base_url}/healthz", timeout=5)
+    r2 = session.get(f"{base_url}/healthz", timeout=5)
 
     rid1 = r1.headers.get("X-Request-Id")
     rid2 = r2.headers.get("X-Request-Id")
@@ -114,21 +119,21 @@ def test_request_id_present_and_unique(base_url: str) -> None:
     assert rid1 != rid2
 
 
-def test_rate_limit_retry_after_present(base_url: str) -> None:
+def test_rate_limit_retry_after_present(base_url: str, session: requests.Session) -> None:
     _State.rate_limit_next = True
-    r = requests.get(f"{base_url}/metrics/device.model", timeout=5)
+    r = session.get(f"{base_url}/metrics/device.model", timeout=5)
     assert r.status_code == 429
     assert r.headers.get("Retry-After")
 
     # Next request succeeds.
-    r2 = requests.get(f"{base_url}/metrics/device.model", timeout=5)
+    r2 = session.get(f"{base_url}/metrics/device.model", timeout=5)
     assert r2.status_code == 200
     assert (r2.json() or {}).get("value") == "eyeSight-DEMO"
 
 
-def test_health_endpoint_fast(base_url: str) -> None:
+def test_health_endpoint_fast(base_url: str, session: requests.Session) -> None:
     start = time.perf_counter()
-    r = requests.get(f"{base_url}/healthz", timeout=5)
+    r = session.get(f"{base_url}/healthz", timeout=5)
     elapsed_ms = (time.perf_counter() - start) * 1000.0
     assert r.status_code == 200
     assert elapsed_ms < 200.0
@@ -5,7 +5,7 @@ import json
 import pytest
 
 from regression.api_reporting import record_api_call, write_api_report
-from regression.evidence import sha256_file, write_evidence_bundle
+from regression.evidence import get_git_info, sha256_file, write_evidence_bundle
 
 
 def test_evidence_bundle_contains_hashes_and_no_secrets(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -39,3 +39,20 @@ def test_evidence_bundle_contains_hashes_and_no_secrets(tmp_path, monkeypatch: p
     text = evidence_path.read_text(encoding="utf-8")
     assert "supersecret" not in text
     assert "Bearer " not in text
+
+
+def test_git_info_falls_back_to_packed_refs(tmp_path) -> None:
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+    (git_dir / "packed-refs").write_text(
+        "# pack-refs with: peeled fully-peeled sorted\n"
+        "1111111111111111111111111111111111111111 refs/heads/feature\n"
+        "2222222222222222222222222222222222222222 refs/heads/main\n"
+        "^3333333333333333333333333333333333333333\n",
+        encoding="utf-8",
+    )
+
+    git = get_git_info(tmp_path)
+    assert git.branch == "main"
+    assert git.head == "2222222222222222222222222222222222222222"
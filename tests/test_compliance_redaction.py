@@ -2,36 +2,37 @@ from __future__ import annotations
 
 import json
 import threading
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
 
+from _mock_http import PooledHTTPServer, QuietHandler
 from regression.api_reporting import write_api_report
+from regression.redaction import redact_values
 from regression.sut import load_sut_adapter
 
 
-class _Handler(BaseHTTPRequestHandler):
+# The mock only ever answers with this one body, so it is encoded once at import.
+_BODY_MODEL = b'{"value": "eyeSight-DEMO"}'
+
+
+class _Handler(QuietHandler):
     def do_GET(self) -> None:  # noqa: N802
-        b = b'{"value": "eyeSight-DEMO"}'
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(b)))
-        self.end_headers()
-        self.wfile.write(b)
+        self._send_bytes(200, _BODY_MODEL)
 
 
 @pytest.fixture()
 def base_url() -> str:
-    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server = PooledHTTPServer(("127.0.0.1", 0), _Handler)
     host, port = server.server_address
 
-    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
     t.start()
 
     try:
         yield f"http://{host}:{port}"
     finally:
         server.shutdown()
+        server.server_close()
 
 
 def test_api_report_redacts_query_params(monkeypatch: pytest.MonkeyPatch, tmp_path, base_url: str) -> None:
@@ -55,3 +56,12 @@ def test_api_report_redacts_query_params(monkeypatch: pytest.MonkeyPatch, tmp_pa
 
     assert "supersecret" not in text
     assert "api_key=REDACTED" in text
+
+
+def test_redact_values_keeps_json_valid() -> None:
+    data = {"auth": "Bearer abc.def", "nested": [{"h": "basic dXNlcjpwYXNz"}], "n": 3}
+    redacted = redact_values(data)
+
+    assert redacted == {"auth": "Bearer REDACTED", "nested": [{"h": "Basic REDACTED"}], "n": 3}
+    # The string ends right after the token; the closing quote must survive.
+    assert json.loads(json.dumps(redacted)) == redacted
@@ -1,43 +1,41 @@
 from __future__ import annotations
 
 import datetime as dt
-import json
 import ssl
-import tempfile
 import threading
 import warnings
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
 import requests
 from urllib3.exceptions import InsecureRequestWarning
 from cryptography import x509
-from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519
 from cryptography.x509.oid import NameOID
 
+from _mock_http import PooledHTTPServer, QuietHandler
+from regression.json_codec import dumps_bytes
 from regression.sut import load_sut_adapter
 
 
-class _Handler(BaseHTTPRequestHandler):
+# The metrics body is static, so it is serialized once at import.
+_BODY_METRICS = dumps_bytes({"device.model": "eyeSight-DEMO"}, indent=False)
+
+
+class _Handler(QuietHandler):
     def do_GET(self) -> None:  # noqa: N802
-        path = (self.path or "").split("?", 1)[0]
+        path = (self.path or "").partition("?")[0]
         if path == "/metrics":
-            payload = {"device.model": "eyeSight-DEMO"}
-            b = json.dumps(payload).encode("utf-8")
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.send_header("Content-Length", str(len(b)))
-            self.end_headers()
-            self.wfile.write(b)
+            self._send_bytes(200, _BODY_METRICS)
             return
 
-        self.send_response(404)
-        self.end_headers()
+        self._send_bytes(404, b"", content_type=None)
 
 
 def _make_self_signed_cert(hostname: str) -> tuple[bytes, bytes]:
-    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    # Ed25519 keygen is a single fixed-curve scalar multiply, far cheaper than RSA-2048; the
+    # server is TLS 1.3-only, where OpenSSL supports Ed25519 certificates.
+    key = ed25519.Ed25519PrivateKey.generate()
 
     subject = issuer = x509.Name(
         [
@@ -60,44 +58,48 @@ def _make_self_signed_cert(hostname: str) -> tuple[bytes, bytes]:
             x509.SubjectAlternativeName([x509.DNSName(hostname), x509.IPAddress(__import__("ipaddress").ip_address("127.0.0.1"))]),
             critical=False,
         )
-        .sign(key, hashes.SHA256())
+        .sign(key, None)
     )
 
     cert_pem = cert.public_bytes(serialization.Encoding.PEM)
     key_pem = key.private_bytes(
         encoding=serialization.Encoding.PEM,
-        format=serialization.PrivateFormat.TraditionalOpenSSL,
+        format=serialization.PrivateFormat.PKCS8,
         encryption_algorithm=serialization.NoEncryption(),
     )
     return cert_pem, key_pem
 
 
-@pytest.fixture()
-def https_base_url() -> str:
+@pytest.fixture(scope="module")
+def https_base_url(tmp_path_factory: pytest.TempPathFactory) -> str:
     hostname = "127.0.0.1"
+    # Generated once per module; both TLS tests share the keypair.
     cert_pem, key_pem = _make_self_signed_cert(hostname)
 
-    server = ThreadingHTTPServer((hostname, 0), _Handler)
+    server = PooledHTTPServer((hostname, 0), _Handler)
     host, port = server.server_address
 
-    # Write cert/key to temp files for SSLContext
-    with tempfile.NamedTemporaryFile(delete=False) as cert_f, tempfile.NamedTemporaryFile(delete=False) as key_f:
-        cert_f.write(cert_pem)
-        cert_f.flush()
-        key_f.write(key_pem)
-        key_f.flush()
+    # Write cert/key to pytest's temp dir for SSLContext (cleaned up with the other run dirs).
+    tls_dir = tmp_path_factory.mktemp("tls")
+    cert_file = tls_dir / "cert.pem"
+    key_file = tls_dir / "key.pem"
+    cert_file.write_bytes(cert_pem)
+    key_file.write_bytes(key_pem)
 
-        ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
-        ctx.load_cert_chain(certfile=cert_f.name, keyfile=key_f.name)
-        server.socket = ctx.wrap_socket(server.socket, server_side=True)
+    ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    # TLS 1.3 only: one-round-trip handshakes and AEAD-only suites (AES-GCM / ChaCha20).
+    ctx.minimum_version = ssl.TLSVersion.TLSv1_3
+    ctx.load_cert_chain(certfile=cert_file, keyfile=key_file)
+    server.socket = ctx.wrap_socket(server.socket, server_side=True)
 
-    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
     t.start()
 
     try:
         yield f"https://{host}:{port}"
     finally:
         server.shutdown()
+        server.server_close()
 
 
 def test_encryption_verification_tls_required(monkeypatch: pytest.MonkeyPatch, https_base_url: str) -> None:
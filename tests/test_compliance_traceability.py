@@ -1,46 +1,43 @@
 from __future__ import annotations
 
-import json
+import secrets
 import threading
 import time
-import uuid
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from collections import deque
+from collections.abc import Iterator
+from itertools import count
 
 import pytest
 import requests
 
+from _mock_http import PooledHTTPServer, QuietHandler
+from regression.json_codec import dumps_bytes
+
 
 class _AuditStore:
+    # Same lock-free store as the audit logging test: deque append/copy are atomic under the GIL.
     def __init__(self) -> None:
-        self._lock = threading.Lock()
-        self.events: list[dict] = []
+        self.events: deque[dict] = deque()
 
     def add(self, event: dict) -> None:
-        with self._lock:
-            self.events.append(event)
+        self.events.append(event)
 
     def snapshot(self) -> list[dict]:
-        with self._lock:
-            return list(self.events)
+        return list(self.events)
 
 
 @pytest.fixture()
 def server() -> tuple[str, _AuditStore]:
     store = _AuditStore()
+    # Unique per fixture without a getrandom call per request.
+    rid_prefix = secrets.token_hex(8)
+    rid_seq = count(1)
 
-    class Handler(BaseHTTPRequestHandler):
-        def _send_json(self, status: int, payload: object, *, request_id: str) -> None:
-            b = json.dumps(payload).encode("utf-8")
-            self.send_response(status)
-            self.send_header("Content-Type", "application/json")
-            self.send_header("X-Request-Id", request_id)
-            self.send_header("Content-Length", str(len(b)))
-            self.end_headers()
-            self.wfile.write(b)
-
+    class Handler(QuietHandler):
         def do_GET(self) -> None:  # noqa: N802
-            request_id = str(uuid.uuid4())
-            path = (self.path or "").split("?", 1)[0]
+            request_id = f"{rid_prefix}-{next(rid_seq):08d}"
+            rid_header = {"X-Request-Id": request_id}
+            path = (self.path or "").partition("?")[0]
             auth = (self.headers.get("Authorization") or "").strip()
 
             actor = "anonymous"
@@ -66,42 +63,50 @@ def server() -> tuple[str, _AuditStore]:
 
             if path == "/metrics/device.model":
                 if actor in ("viewer", "admin"):
-                    self._send_json(200, {"value": "eyeSight-DEMO"}, request_id=request_id)
+                    self._send_json(200, {"value": "eyeSight-DEMO"}, extra_headers=rid_header)
                 else:
-                    self._send_json(401, {"error": "unauthorized"}, request_id=request_id)
+                    self._send_json(401, {"error": "unauthorized"}, extra_headers=rid_header)
                 return
 
             if path == "/audit/events":
                 if actor == "admin":
-                    self._send_json(200, {"events": store.snapshot()}, request_id=request_id)
+                    self._send_json(200, {"events": store.snapshot()}, extra_headers=rid_header)
                 else:
-                    self._send_json(403, {"error": "forbidden"}, request_id=request_id)
+                    self._send_json(403, {"error": "forbidden"}, extra_headers=rid_header)
                 return
 
-            self._send_json(404, {"error": "not_found"}, request_id=request_id)
+            self._send_json(404, {"error": "not_found"}, extra_headers=rid_header)
 
-    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd = PooledHTTPServer(("127.0.0.1", 0), Handler)
     host, port = httpd.server_address
 
-    t = threading.Thread(target=httpd.serve_forever, daemon=True)
+    t = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
     t.start()
 
     try:
         yield f"http://{host}:{port}", store
     finally:
         httpd.shutdown()
+        httpd.server_close()
+
+
+@pytest.fixture(scope="module")
+def session() -> Iterator[requests.Session]:
+    # One pooled session per module, so sequential requests reuse a kept-alive connection.
+    with requests.Session() as s:
+        yield s
 
 
-def test_traceability_request_id_and_audit_linkage(server: tuple[str, _AuditStore]) -> None:
+def test_traceability_request_id_and_audit_linkage(server: tuple[str, _AuditStore], session: requests.Session) -> None:
     base_url, _store = server
 
     # Make two requests; each must have a request id.
-    r1 = requests.get(
+    r1 = session.get(
         f"{base_url}/metrics/device.model",
         headers={"Authorization": "Bearer viewer-token"},
         timeout=5,
     )
-    r2 = requests.get(
+    r2 = session.get(
         f"{base_url}/metrics/device.model",
         headers={"Authorization": "Bearer viewer-token"},
         timeout=5,
@@ -115,7 +120,7 @@ def test_traceability_request_id_and_audit_linkage(server: tuple[str, _AuditStor
     assert rid1 != rid2
 
     # Pull audit events and ensure request_ids show up and can be linked.
-    r3 = requests.get(
+    r3 = session.get(
         f"{base_url}/audit/events",
         headers={"Authorization": "Bearer admin-token"},
         timeout=5,
@@ -129,8 +134,6 @@ def test_traceability_request_id_and_audit_linkage(server: tuple[str, _AuditStor
     assert rid2 in event_ids
 
     # Ensure audit events do not store raw Authorization header values.
-    for e in events:
-        s = json.dumps(e)
-        assert "Bearer" not in s
-        assert "viewer-token" not in s
-        assert "admin-token" not in s
+    blob = dumps_bytes(events, indent=False)
+    for needle in (b"Bearer", b"viewer-token", b"admin-token"):
+        assert needle not in blob
@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+import os
+from pathlib import Path
+
+import pytest
 from cryptography.fernet import Fernet
 
-from regression.at_rest_encryption import decrypt_bytes, encrypt_bytes
+from regression import at_rest_encryption
+from regression.at_rest_encryption import (
+    decrypt_bytes,
+    decrypt_file,
+    encrypt_bytes,
+    write_encrypted_copy_if_configured,
+)
 
 
 def test_at_rest_encryption_roundtrip(monkeypatch) -> None:  # noqa: ANN001
@@ -17,3 +27,56 @@ def test_at_rest_encryption_roundtrip(monkeypatch) -> None:  # noqa: ANN001
 
     recovered = decrypt_bytes(ciphertext)
     assert recovered == plaintext
+
+
+@pytest.mark.parametrize("stream", ["", "1"])
+def test_encrypted_artifact_copy_roundtrip(tmp_path, monkeypatch: pytest.MonkeyPatch, stream: str) -> None:
+    monkeypatch.setenv("ARTIFACT_ENCRYPTION_KEY", Fernet.generate_key().decode("utf-8"))
+    monkeypatch.setenv("ARTIFACT_ENCRYPTION_STREAM", stream)
+    # Force the streamed path for a small file; keep chunks small to exercise the loop.
+    monkeypatch.setattr(at_rest_encryption, "_STREAM_THRESHOLD_BYTES", 0)
+    monkeypatch.setattr(at_rest_encryption, "_STREAM_CHUNK_BYTES", 7)
+
+    src = tmp_path / "report.json"
+    src.write_bytes(b"{\"secret\":\"do-not-store-in-plain\"}" * 5)
+
+    enc = write_encrypted_copy_if_configured(src)
+    assert enc
+    assert b"do-not-store-in-plain" not in (tmp_path / "report.json.enc").read_bytes()
+
+    out = tmp_path / "report.dec.json"
+    decrypt_file(enc, out)
+    assert out.read_bytes() == src.read_bytes()
+
+    # Tampering must be detected in either format.
+    data = bytearray((tmp_path / "report.json.enc").read_bytes())
+    data[len(data) // 2] ^= 1
+    (tmp_path / "report.json.enc").write_bytes(bytes(data))
+    with pytest.raises(ValueError):
+        decrypt_file(enc, tmp_path / "tampered.json")
+
+
+def test_streamed_decrypt_fails_cleanly_if_file_shrinks(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ARTIFACT_ENCRYPTION_KEY", Fernet.generate_key().decode("utf-8"))
+    monkeypatch.setenv("ARTIFACT_ENCRYPTION_STREAM", "1")
+    monkeypatch.setattr(at_rest_encryption, "_STREAM_THRESHOLD_BYTES", 0)
+
+    src = tmp_path / "report.json"
+    src.write_bytes(os.urandom(256 * 1024))
+    enc = Path(write_encrypted_copy_if_configured(src))
+    out = tmp_path / "report.dec.json"
+    part = tmp_path / "report.dec.json.part"
+
+    # Truncate the ciphertext once decryption has started writing, i.e. after the size check.
+    real_open = Path.open
+
+    def _open(self: Path, *args, **kwargs):  # noqa: ANN002, ANN003, ANN202
+        if self == part:
+            os.truncate(enc, 1024)
+        return real_open(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "open", _open)
+    with pytest.raises(ValueError):
+        decrypt_file(enc, out)
+    assert not out.exists()
+    assert not part.exists()
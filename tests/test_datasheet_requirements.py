@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 import pytest
@@ -10,6 +10,11 @@ import yaml
 
 from regression.sut import load_sut_adapter
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 
 @dataclass(frozen=True)
 class Requirement:
@@ -19,24 +24,40 @@ class Requirement:
     metric: str
     expected: dict[str, Any]
     source: dict[str, Any] | None = None
+    # Compiled expected.pattern for regex requirements, built once at load time.
+    compiled: re.Pattern[str] | None = field(default=None, repr=False, compare=False)
+
+
+def _compile_pattern(rtype: str, expected: dict[str, Any]) -> re.Pattern[str] | None:
+    pattern = expected.get("pattern")
+    if rtype != "regex" or not isinstance(pattern, str) or not pattern:
+        return None
+    try:
+        return re.compile(pattern)
+    except re.error:
+        # Leave it to _assert_requirement so the error is reported against the requirement.
+        return None
 
 
 def _load_requirements(path: str) -> list[Requirement]:
     with open(path, "r", encoding="utf-8") as f:
-        doc = yaml.safe_load(f) or {}
+        doc = yaml.load(f.read(), Loader=_SafeLoader) or {}
 
     items = doc.get("requirements") or []
     reqs: list[Requirement] = []
 
     for item in items:
+        rtype = str(item["type"])
+        expected = dict(item.get("expected") or {})
         reqs.append(
             Requirement(
                 id=str(item["id"]),
                 title=str(item.get("title") or ""),
-                type=str(item["type"]),
+                type=rtype,
                 metric=str(item["metric"]),
-                expected=dict(item.get("expected") or {}),
+                expected=expected,
                 source=item.get("source"),
+                compiled=_compile_pattern(rtype, expected),
             )
         )
 
@@ -101,7 +122,8 @@ def _assert_requirement(requirement: Requirement, actual_value: Any) -> None:
             f"{requirement.id}: expected.pattern must be a non-empty string"
         )
         actual_s = "" if actual_value is None else str(actual_value)
-        assert re.search(pattern, actual_s), (
+        compiled = requirement.compiled or re.compile(pattern)
+        assert compiled.search(actual_s), (
             f"{requirement.id}: '{requirement.metric}' value {actual_s!r} did not match /{pattern}/"
         )
         return
@@ -122,6 +144,7 @@ def test_datasheet_requirements() -> None:
     except RuntimeError as e:
         pytest.skip(f"SUT not configured: {e}")
 
+    # One batched fetch (concurrent in API template mode), then assert in requirement order.
+    values = sut.get_metrics([req.metric for req in requirements])
     for req in requirements:
-        actual_value = sut.get_metric(req.metric)
-        _assert_requirement(req, actual_value)
+        _assert_requirement(req, values[req.metric])
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from tools import extract_datasheet_requirements as extract
+
+
+_PDF = Path(__file__).resolve().parents[1] / "eyeSight Datasheet.pdf"
+
+
+def test_extract_defaults_to_pypdf_even_if_pdfium_is_installed(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _fail(pdf_path: str):  # noqa: ANN202
+        raise AssertionError("PDFium backend must be opted into explicitly")
+
+    monkeypatch.setattr(extract, "_extract_text_pdfium", _fail)
+    pages = list(extract.extract_text_by_page(str(_PDF)))
+    assert pages and any(pages)
+
+
+def test_extract_pdfium_requires_pypdfium2(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(extract, "pdfium", None)
+    with pytest.raises(RuntimeError):
+        next(extract.extract_text_by_page(str(_PDF), backend="pdfium"))
+
+
+def test_extract_pdfium_backend_yields_candidates() -> None:
+    pytest.importorskip("pypdfium2")
+
+    pages = list(extract.extract_text_by_page(str(_PDF), backend="pdfium"))
+    assert len(pages) == len(list(extract.extract_text_by_page(str(_PDF))))
+    assert all("\r" not in p for p in pages)
+
+    candidates = list(extract.generate_candidates(pages))
+    assert candidates
+    assert [c.id for c in candidates] == [f"CAND-{i:04d}" for i in range(1, len(candidates) + 1)]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+import re
 from pathlib import Path
 
 from regression.html_report import write_html_report
@@ -20,3 +22,40 @@ def test_write_html_report_creates_index(tmp_path: Path) -> None:
     assert "<!doctype html>" in text.lower()
     assert "run_report.json" in text
     assert "README.md" in text
+
+
+def test_write_html_report_embeds_payload_as_json_block(tmp_path: Path) -> None:
+    rr = tmp_path / "run_report.json"
+    rr.write_text('{"pytest":{"exitstatus":0,"counts":{"passed":1,"failed":0}}}', encoding="utf-8")
+
+    out = tmp_path / "index.html"
+    write_html_report(out, run_report_path=str(rr), api_report_path=None, evidence_path=None)
+
+    text = out.read_text(encoding="utf-8")
+    m = re.search(r'<script type="application/json" id="reportData">(.*?)</script>', text, re.DOTALL)
+    assert m
+    assert json.loads(m.group(1))["run"]["pytest"]["counts"]["passed"] == 1
+
+
+def test_write_html_report_prerenders_summaries_and_escapes_markup(tmp_path: Path) -> None:
+    run = {"pytest": {"exitstatus": 1, "counts": {"failed": 1}, "failed": ["tests/test_x.py::test_<b>"]}}
+    api = {"summary": {"total_calls": 1, "last_error": "</script><script>alert(1)</script> Bearer abc"}}
+
+    out = tmp_path / "index.html"
+    write_html_report(out, run_report_path=None, api_report_path=None, evidence_path=None, run_report=run, api_report=api)
+
+    text = out.read_text(encoding="utf-8")
+    # Only the two real script elements close; the report value can't end one early.
+    assert text.count("</script>") == 2
+    assert "alert(1)" in text and "<script>alert" not in text
+
+    m = re.search(r'<script type="application/json" id="reportData">(.*?)</script>', text, re.DOTALL)
+    assert m
+    data = json.loads(m.group(1))
+    assert data["api"]["summary"]["last_error"] == "</script><script>alert(1)</script> Bearer REDACTED"
+
+    pytest_pre = re.search(r'<pre id="pytestSummary">(.*?)</pre>', text, re.DOTALL)
+    assert pytest_pre and "test_&lt;b&gt;" in pytest_pre.group(1)
+    api_pre = re.search(r'<pre id="apiSummary">(.*?)</pre>', text, re.DOTALL)
+    assert api_pre and "Bearer REDACTED" in api_pre.group(1)
+    assert "JSON.stringify" not in text
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import json
+
+import pytest
+
+from regression import json_codec
+from regression.json_codec import dumps_bytes
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_bytes_roundtrips_with_and_without_orjson(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    if use_orjson and json_codec.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(json_codec, "orjson", None)
+
+    obj = {"a": 1, "b": [1.5, None, True], "c": {"nested": "café"}}
+    assert json.loads(dumps_bytes(obj)) == obj
+    assert json.loads(dumps_bytes(obj, indent=False)) == obj
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_bytes_sort_keys_matches_stdlib(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    if use_orjson and json_codec.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(json_codec, "orjson", None)
+
+    obj = {"b": {"z": 1, "y": 2}, "a": [3]}
+    assert dumps_bytes(obj, sort_keys=True) == json.dumps(obj, indent=2, sort_keys=True).encode("utf-8")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_bytes_writes_non_finite_floats_as_null(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    if use_orjson and json_codec.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(json_codec, "orjson", None)
+
+    obj = {"ok": None, "nan": float("nan"), "inf": [1.5, float("-inf")]}
+    assert dumps_bytes(obj, indent=False) == b'{"ok":null,"nan":null,"inf":[1.5,null]}'
+
+    @dataclasses.dataclass
+    class _Point:
+        x: int
+
+    for unsupported in (_Point(1), datetime.datetime(2024, 1, 1)):
+        with pytest.raises(TypeError):
+            dumps_bytes({"v": unsupported})
+
+
+def test_dumps_bytes_handles_non_str_keys() -> None:
+    # orjson rejects int keys by default; the stdlib fallback must take over.
+    assert json.loads(dumps_bytes({1: "x"})) == {"1": "x"}
+
+
+def test_dumps_bytes_stdlib_fallback_matches_json_dumps(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(json_codec, "orjson", None)
+
+    obj = {"name": "café", "values": [1, 2.5]}
+    assert dumps_bytes(obj) == json.dumps(obj, indent=2).encode("utf-8")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_loads_accepts_what_stdlib_accepts(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    if use_orjson and json_codec.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(json_codec, "orjson", None)
+
+    assert json_codec.loads(b'{"a": [1, 2.5, "caf\\u00e9"]}') == {"a": [1, 2.5, "café"]}
+    # orjson rejects NaN; the stdlib fallback keeps it loadable.
+    assert json_codec.loads('{"x": NaN}')["x"] != json_codec.loads('{"x": NaN}')["x"]
+
+    with pytest.raises(ValueError):
+        json_codec.loads(b"{not json")
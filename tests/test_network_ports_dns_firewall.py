@@ -3,7 +3,6 @@ from __future__ import annotations
 import errno
 import socket
 import threading
-import time
 
 import pytest
 
@@ -80,18 +79,25 @@ def test_firewall_like_behavior_timeout_vs_refused() -> None:
         listener.listen(1)
         host2, port2 = listener.getsockname()
 
+        client_done = threading.Event()
+
         def slow_server() -> None:
             conn, _addr = listener.accept()
             with conn:
-                time.sleep(1.0)
+                # Stay silent until the client has seen its timeout, then close straight away
+                # (the 1s cap only matters if the client side fails early).
+                client_done.wait(timeout=1.0)
 
         t = threading.Thread(target=slow_server, daemon=True)
         t.start()
 
-        with socket.create_connection((host2, port2), timeout=0.5) as client:
-            client.settimeout(0.2)
-            with pytest.raises(TimeoutError):
-                client.recv(1)
+        try:
+            with socket.create_connection((host2, port2), timeout=0.5) as client:
+                client.settimeout(0.2)
+                with pytest.raises(TimeoutError):
+                    client.recv(1)
+        finally:
+            client_done.set()
 
         t.join(timeout=2)
         assert not t.is_alive()
@@ -1,37 +1,30 @@
 from __future__ import annotations
 
 import socket
-import threading
 
 import pytest
 
 
 def test_tcp_vs_udp_basic_roundtrip() -> None:
+    # Both sides run in this thread: the kernel completes the TCP handshake into the listen
+    # backlog and queues datagrams, so no server thread is needed. Timeouts bound every wait.
+
     # TCP: connection-oriented
     tcp_listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     try:
         tcp_listener.bind(("127.0.0.1", 0))
         tcp_listener.listen(1)
+        tcp_listener.settimeout(2)
         tcp_host, tcp_port = tcp_listener.getsockname()
 
-        tcp_received: list[bytes] = []
-
-        def tcp_server() -> None:
+        with socket.create_connection((tcp_host, tcp_port), timeout=2) as tcp_client:
             conn, _addr = tcp_listener.accept()
             with conn:
-                tcp_received.append(conn.recv(1024))
+                conn.settimeout(2)
+                tcp_client.sendall(b"ping")
+                assert conn.recv(1024) == b"ping"
                 conn.sendall(b"pong")
-
-        t = threading.Thread(target=tcp_server, daemon=True)
-        t.start()
-
-        with socket.create_connection((tcp_host, tcp_port), timeout=2) as tcp_client:
-            tcp_client.sendall(b"ping")
-            assert tcp_client.recv(1024) == b"pong"
-
-        t.join(timeout=2)
-        assert not t.is_alive()
-        assert tcp_received == [b"ping"]
+                assert tcp_client.recv(1024) == b"pong"
     finally:
         tcp_listener.close()
 
@@ -40,26 +33,18 @@ def test_tcp_vs_udp_basic_roundtrip() -> None:
     udp_client = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     try:
         udp_sock.bind(("127.0.0.1", 0))
+        udp_sock.settimeout(2)
         udp_host, udp_port = udp_sock.getsockname()
 
-        udp_received: list[bytes] = []
-
-        def udp_server() -> None:
-            data, _addr = udp_sock.recvfrom(2048)
-            udp_received.append(data)
-
-        u = threading.Thread(target=udp_server, daemon=True)
-        u.start()
-
         udp_client.sendto(b"ping", (udp_host, udp_port))
 
-        u.join(timeout=2)
-        assert not u.is_alive()
-        assert udp_received == [b"ping"]
+        data, _addr = udp_sock.recvfrom(2048)
+        assert data == b"ping"
     finally:
         udp_sock.close()
         udp_client.close()
 
+
 def test_udp_send_to_unused_port_does_not_guarantee_error() -> None:
     # Demonstrates that UDP has no handshake: sending to a port with no listener
     # may not fail immediately (depends on ICMP behavior).
@@ -1,41 +1,35 @@
 from __future__ import annotations
 
 import base64
-import json
 import threading
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from urllib.parse import parse_qs
 
 import pytest
 
+from _mock_http import PooledHTTPServer, QuietHandler
 from regression.sut import load_sut_adapter
 
 
-class _Handler(BaseHTTPRequestHandler):
+_EXPECTED_BASIC = "Basic " + base64.b64encode(b"client:secret").decode("ascii")
+
+
+class _Handler(QuietHandler):
     token_calls = 0
     last_token = ""
 
-    def _send_json(self, status: int, payload: object) -> None:
-        b = json.dumps(payload).encode("utf-8")
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(b)))
-        self.end_headers()
-        self.wfile.write(b)
-
     def do_POST(self) -> None:  # noqa: N802
-        path = (self.path or "").split("?", 1)[0]
+        # Consume the form body up front so early rejections leave the connection reusable.
+        body = self.rfile.read(int(self.headers.get("Content-Length") or "0")).decode("utf-8")
+
+        path = (self.path or "").partition("?")[0]
         if path != "/oauth/token":
             self._send_json(404, {"error": "not_found"})
             return
 
-        expected = "Basic " + base64.b64encode(b"client:secret").decode("ascii")
-        if (self.headers.get("Authorization") or "") != expected:
+        if (self.headers.get("Authorization") or "") != _EXPECTED_BASIC:
             self._send_json(401, {"error": "invalid_client"})
             return
 
-        length = int(self.headers.get("Content-Length") or "0")
-        body = self.rfile.read(length).decode("utf-8")
         form = parse_qs(body)
         if (form.get("grant_type") or [""])[0] != "client_credentials":
             self._send_json(400, {"error": "unsupported_grant_type"})
@@ -49,7 +43,7 @@ class _Handler(BaseHTTPRequestHandler):
         self._send_json(200, {"access_token": tok, "token_type": "Bearer", "expires_in": 0})
 
     def do_GET(self) -> None:  # noqa: N802
-        path = (self.path or "").split("?", 1)[0]
+        path = (self.path or "").partition("?")[0]
         if path != "/metrics/device.model":
             self._send_json(404, {"error": "not_found"})
             return
@@ -67,16 +61,17 @@ def base_url() -> str:
     _Handler.token_calls = 0
     _Handler.last_token = ""
 
-    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server = PooledHTTPServer(("127.0.0.1", 0), _Handler)
     host, port = server.server_address
 
-    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
     t.start()
 
     try:
         yield f"http://{host}:{port}"
     finally:
         server.shutdown()
+        server.server_close()
 
 
 def test_oauth2_refreshes_expired_token(monkeypatch: pytest.MonkeyPatch, base_url: str) -> None:
@@ -13,7 +13,7 @@ def test_write_run_report_includes_artifact_hashes(tmp_path) -> None:
     evidence.write_text(json.dumps({"run_id": "r1", "config": {"sut_base_url": "REDACTED"}}), encoding="utf-8")
 
     out = tmp_path / "run_report.json"
-    p = write_run_report(
+    result = write_run_report(
         out,
         exitstatus=0,
         duration_s=1.23,
@@ -24,8 +24,41 @@ def test_write_run_report_includes_artifact_hashes(tmp_path) -> None:
     )
 
     data = json.loads((tmp_path / "run_report.json").read_text(encoding="utf-8"))
-    assert p
+    assert result.path == str(out)
+    assert result.report == data
+    assert result.api_report == {"summary": {"total_calls": 1, "total_errors": 0}}
     assert data["pytest"]["exitstatus"] == 0
     assert data["api"]["summary"]["total_calls"] == 1
     assert data["artifacts"]["api_report"]["sha256"]
     assert data["artifacts"]["evidence"]["sha256"]
+
+
+def test_write_run_report_redacts_parsed_artifacts(tmp_path) -> None:
+    api_report = tmp_path / "api_report.json"
+    api_report.write_text(json.dumps({"summary": {"total_calls": 1}}), encoding="utf-8")
+    evidence = tmp_path / "evidence.json"
+    evidence.write_text(json.dumps({"run_id": "r1"}), encoding="utf-8")
+
+    # The passed objects win over the files, and get the same redaction.
+    api_obj = {"summary": {"total_calls": 2, "last_error": "401 for Bearer abc.def"}}
+    evidence_obj = {"run_id": "r2", "config": {"auth": "Basic dXNlcjpwYXNz"}}
+
+    out = tmp_path / "run_report.json"
+    write_run_report(
+        out,
+        exitstatus=0,
+        duration_s=None,
+        test_counts={"passed": 1},
+        failed_nodeids=[],
+        api_report_path=str(api_report),
+        evidence_path=str(evidence),
+        api_report_obj=api_obj,
+        evidence_obj=evidence_obj,
+    )
+
+    data = json.loads(out.read_text(encoding="utf-8"))
+    assert data["api"]["summary"] == {"total_calls": 2, "last_error": "401 for Bearer REDACTED"}
+    assert data["evidence"] == {"run_id": "r2", "config": {"auth": "Basic REDACTED"}}
+    # The hashes still come from the files on disk.
+    assert data["artifacts"]["api_report"]["bytes"] == api_report.stat().st_size
+    assert data["artifacts"]["evidence"]["bytes"] == evidence.stat().st_size
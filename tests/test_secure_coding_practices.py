@@ -1,33 +1,40 @@
 from __future__ import annotations
 
-import json
 import re
 import threading
 from collections.abc import Iterator
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
 import requests
 
+from _mock_http import PooledHTTPServer, QuietHandler
+from regression.json_codec import loads
+
 
 _ADMIN_TOKEN = "admin-token"
 _VIEWER_TOKEN = "viewer-token"
+_JSON_CONTENT_TYPE = "application/json"
+# Allowlist for item names; length is bounded separately before this runs.
+_NAME_RE = re.compile(r"[A-Za-z0-9_.-]+")
+
 
 
-def _bearer_token(headers: dict[str, str]) -> str | None:
-    auth = (headers.get("Authorization") or "").strip()
+def _bearer_token(auth_header: str | None) -> str | None:
+    auth = (auth_header or "").strip()
     if not auth.startswith("Bearer "):
         return None
-    return auth.split(" ", 1)[1].strip() or None
+    return auth[len("Bearer ") :].strip() or None
 
 
-class _SecureHandler(BaseHTTPRequestHandler):
+class _SecureHandler(QuietHandler):
     server_version = "secure-demo/1.0"
 
     def _drain_request_body(self) -> None:
         # If we return early on a POST without consuming the request body,
         # Windows may abort/reset the connection, which can surface in the
-        # client as ConnectionAbortedError while reading the response.
+        # client as ConnectionAbortedError while reading the response. On a
+        # kept-alive connection the leftover bytes would also be parsed as the
+        # next request.
         try:
             length = int(self.headers.get("Content-Length") or "0")
         except Exception:
@@ -37,28 +44,14 @@ class _SecureHandler(BaseHTTPRequestHandler):
             try:
                 self.rfile.read(length)
             except Exception:
-                # Best effort only; response correctness matters more than strict draining.
-                pass
-
-    def _send_json(self, status: int, payload: object) -> None:
-        b = json.dumps(payload).encode("utf-8")
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(b)))
-        self.send_header("Connection", "close")
-        self.end_headers()
-        self.wfile.write(b)
-        try:
-            self.wfile.flush()
-        except Exception:
-            pass
-        self.close_connection = True
+                # Best effort only; if the body can't be consumed, don't reuse the connection.
+                self.close_connection = True
 
     def _authn(self) -> str | None:
-        return _bearer_token({"Authorization": self.headers.get("Authorization") or ""})
+        return _bearer_token(self.headers.get("Authorization"))
 
     def do_GET(self) -> None:  # noqa: N802
-        if (self.path or "").split("?", 1)[0] != "/secure/items":
+        if (self.path or "").partition("?")[0] != "/secure/items":
             self._send_json(404, {"error": "not_found"})
             return
 
@@ -76,7 +69,7 @@ class _SecureHandler(BaseHTTPRequestHandler):
         self._send_json(200, {"items": [{"id": "item-1"}]})
 
     def do_POST(self) -> None:  # noqa: N802
-        if (self.path or "").split("?", 1)[0] != "/secure/items":
+        if (self.path or "").partition("?")[0] != "/secure/items":
             self._drain_request_body()
             self._send_json(404, {"error": "not_found"})
             return
@@ -95,7 +88,7 @@ class _SecureHandler(BaseHTTPRequestHandler):
             return
 
         ctype = (self.headers.get("Content-Type") or "").lower()
-        if "application/json" not in ctype:
+        if _JSON_CONTENT_TYPE not in ctype:
             self._drain_request_body()
             self._send_json(415, {"error": "unsupported_media_type"})
             return
@@ -109,7 +102,8 @@ class _SecureHandler(BaseHTTPRequestHandler):
         length = int(self.headers.get("Content-Length") or "0")
         raw = self.rfile.read(length)
         try:
-            payload = json.loads(raw.decode("utf-8") or "{}")
+            # Parse the bytes directly; an empty body is treated as an empty object.
+            payload = loads(raw) if raw else {}
         except Exception:
             self._send_json(400, {"error": "invalid_json"})
             return
@@ -124,41 +118,49 @@ class _SecureHandler(BaseHTTPRequestHandler):
             self._send_json(400, {"error": "name_length"})
             return
 
-        if not re.fullmatch(r"[A-Za-z0-9_.-]+", name):
+        if not _NAME_RE.fullmatch(name):
             self._send_json(400, {"error": "name_format"})
             return
 
         self._send_json(201, {"id": "item-2", "name": name})
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def base_url() -> Iterator[str]:
-    server = ThreadingHTTPServer(("127.0.0.1", 0), _SecureHandler)
+    server = PooledHTTPServer(("127.0.0.1", 0), _SecureHandler)
     host, port = server.server_address
 
-    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
     t.start()
 
     try:
         yield f"http://{host}:{port}"
     finally:
         server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(scope="module")
+def session() -> Iterator[requests.Session]:
+    # One pooled session per module, so sequential requests reuse a kept-alive connection.
+    with requests.Session() as s:
+        yield s
 
 
-def test_authentication_vs_authorization(base_url: str) -> None:
+def test_authentication_vs_authorization(base_url: str, session: requests.Session) -> None:
     # AuthN: missing token => 401
-    r = requests.get(f"{base_url}/secure/items", timeout=2)
+    r = session.get(f"{base_url}/secure/items", timeout=2)
     assert r.status_code == 401
 
     # AuthZ: viewer token => can read but cannot write (403)
-    r = requests.get(
+    r = session.get(
         f"{base_url}/secure/items",
         headers={"Authorization": f"Bearer {_VIEWER_TOKEN}"},
         timeout=2,
     )
     assert r.status_code == 200
 
-    r = requests.post(
+    r = session.post(
         f"{base_url}/secure/items",
         headers={"Authorization": f"Bearer {_VIEWER_TOKEN}", "Content-Type": "application/json"},
         json={"name": "valid-name"},
@@ -167,9 +169,9 @@ def test_authentication_vs_authorization(base_url: str) -> None:
     assert r.status_code == 403
 
 
-def test_input_validation_and_safe_errors(base_url: str) -> None:
+def test_input_validation_and_safe_errors(base_url: str, session: requests.Session) -> None:
     # Invalid content-type => 415
-    r = requests.post(
+    r = session.post(
         f"{base_url}/secure/items",
         headers={"Authorization": f"Bearer {_ADMIN_TOKEN}", "Content-Type": "text/plain"},
         data="{\"name\":\"x\"}",
@@ -178,7 +180,7 @@ def test_input_validation_and_safe_errors(base_url: str) -> None:
     assert r.status_code == 415
 
     # Invalid JSON => 400
-    r = requests.post(
+    r = session.post(
         f"{base_url}/secure/items",
         headers={"Authorization": f"Bearer {_ADMIN_TOKEN}", "Content-Type": "application/json", "X-Bad-Json": "true"},
         data="this-is-not-json",
@@ -187,7 +189,7 @@ def test_input_validation_and_safe_errors(base_url: str) -> None:
     assert r.status_code == 400
 
     # Reject dangerous/invalid input (allowlist validation)
-    r = requests.post(
+    r = session.post(
         f"{base_url}/secure/items",
         headers={"Authorization": f"Bearer {_ADMIN_TOKEN}", "Content-Type": "application/json"},
         json={"name": "' OR 1=1 --"},
@@ -196,7 +198,7 @@ def test_input_validation_and_safe_errors(base_url: str) -> None:
     assert r.status_code == 400
 
     # Accept good input
-    r = requests.post(
+    r = session.post(
         f"{base_url}/secure/items",
         headers={"Authorization": f"Bearer {_ADMIN_TOKEN}", "Content-Type": "application/json"},
         json={"name": "safe_name-01"},
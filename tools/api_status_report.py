@@ -1,14 +1,22 @@
 from __future__ import annotations
 
 import argparse
-import json
 import os
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from regression.auth import load_auth_config_from_env
+from regression.auth import AuthConfig, load_auth_config_from_env
+from regression.json_codec import dumps_bytes
+
+
+# Upper bound on concurrent probes; status checks are I/O-bound, so this only caps socket use.
+_MAX_WORKERS = 32
 
 
 def _parse_paths(raw: str) -> list[str]:
@@ -20,6 +28,34 @@ def _parse_paths(raw: str) -> list[str]:
     return items
 
 
+def _probe(
+    session: requests.Session, auth: AuthConfig, url: str, *, timeout_s: float, verify_tls: bool
+) -> dict[str, Any]:
+    start = time.perf_counter()
+    url2 = url
+    status_code = None
+    ok = False
+    error = None
+    try:
+        url2 = auth.apply_url(url)
+        headers = auth.apply_headers({"Accept": "application/json"})
+        r = session.get(url2, timeout=timeout_s, verify=verify_tls, headers=headers)
+        status_code = r.status_code
+        ok = bool(r.ok)
+    except Exception as e:  # noqa: BLE001
+        error = f"{type(e).__name__}: {e}"
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+
+    return {
+        "url": url,
+        "effective_url": url2,
+        "status_code": status_code,
+        "ok": ok,
+        "elapsed_ms": elapsed_ms,
+        "error": error,
+    }
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Check status of one or more API endpoints")
     parser.add_argument(
@@ -52,46 +88,46 @@ def main() -> int:
     if not paths:
         paths = ["/healthz"]
 
-    results = []
-    auth = load_auth_config_from_env()
+    base_prefix = base_url.rstrip("/") + "/"
+    urls = []
     for p in paths:
-        if p.startswith("http://") or p.startswith("https://"):
-            url = p
+        if p.startswith(("http://", "https://")):
+            urls.append(p)
         else:
             if not base_url:
                 raise SystemExit("--base-url (or SUT_BASE_URL) is required for relative paths")
-            url = urljoin(base_url.rstrip("/") + "/", p.lstrip("/"))
+            rel = p.lstrip("/")
+            # Plain relative paths are appended as-is; only dot segments need urljoin's resolution.
+            urls.append(urljoin(base_prefix, rel) if "./" in rel or rel.endswith(".") else base_prefix + rel)
 
-        start = time.perf_counter()
-        status_code = None
-        ok = False
-        error = None
+    auth = load_auth_config_from_env()
+    if auth.mode == "oauth2":
+        # Resolve the token before fanning out: AuthConfig creates its token lock lazily, so
+        # concurrent first calls could each fetch a client-credentials token. This call also
+        # creates the lock. A failure is left to the probes, which report it per endpoint.
         try:
-            url2 = auth.apply_url(url)
-            headers = auth.apply_headers({"Accept": "application/json"})
-            r = requests.get(url2, timeout=args.timeout_s, verify=verify_tls, headers=headers)
-            status_code = r.status_code
-            ok = bool(r.ok)
-        except Exception as e:  # noqa: BLE001
-            error = f"{type(e).__name__}: {e}"
-        elapsed_ms = (time.perf_counter() - start) * 1000.0
-
-        results.append(
-            {
-                "url": url,
-                "effective_url": url2 if 'url2' in locals() else url,
-                "status_code": status_code,
-                "ok": ok,
-                "elapsed_ms": elapsed_ms,
-                "error": error,
-            }
-        )
+            auth.get_bearer_token()
+        except Exception:  # noqa: BLE001
+            pass
+
+    # One session for every path: connections to the same host are kept alive and reused,
+    # so only the first request per connection pays the TCP/TLS handshake. Probes run
+    # concurrently; the pool is sized so each worker can hold its own connection.
+    workers = min(_MAX_WORKERS, len(urls))
+    with requests.Session() as session:
+        adapter = HTTPAdapter(pool_maxsize=workers)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            results = list(
+                ex.map(lambda u: _probe(session, auth, u, timeout_s=args.timeout_s, verify_tls=verify_tls), urls)
+            )
 
     report = {
         "base_url": base_url or None,
         "results": results,
     }
-    print(json.dumps(report, indent=2))
+    sys.stdout.buffer.write(dumps_bytes(report) + b"\n")
 
     # Exit non-zero if any endpoint failed
     if any((not r["ok"]) or r["error"] for r in results):
@@ -3,11 +3,35 @@ from __future__ import annotations
 import argparse
 import os
 import re
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from typing import TextIO
 
 import yaml
 from pypdf import PdfReader
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # optional faster backend (--backend pdfium); pypdf is always available
+    pdfium = None  # type: ignore[assignment]
+
+_BACKENDS = ("pypdf", "pdfium")
+
+
+# A line is interesting if it mentions a spec keyword or carries a number/unit. Both checks
+# are folded into one alternation so each line costs a single search.
+_INTERESTING_RE = re.compile(
+    r"\b(?:must|shall|should|support|supports|require|required|minimum|maximum|max|min|operating|temperature|humidity|throughput|latency|power|voltage|current|frequency|protocol)\b"
+    r"|\d|%|\bms\b|\bps\b|\bmhz\b|\bghz\b|\bmbps\b|\bgbps\b|\bdb\b|\bmm\b|\bcm\b|\bkg\b|\bw\b|\bv\b|\ba\b",
+    re.IGNORECASE,
+)
+
 
 @dataclass(frozen=True)
 class Candidate:
@@ -16,43 +40,90 @@ class Candidate:
     text: str
 
 
-def _normalize_whitespace(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+# Whitespace runs that stay within one line: every \s character except the line boundaries
+# str.splitlines() breaks on. Collapsing these over a whole page and splitting afterwards
+# gives the same lines as normalizing each line separately, in one regex pass per page.
+_INLINE_WS_RE = re.compile(r"[^\S\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]+")
+# List-bullet prefixes; all are single characters, so a set lookup on line[0] suffices.
+_BULLETS = frozenset("-•*")
+
+
+# pypdf's extract_text is pure Python and holds the GIL, so large documents are split across
+# processes. Below this many pages, starting the workers costs more than it saves.
+_PARALLEL_MIN_PAGES = 32
+
+_worker_reader: PdfReader | None = None
+
+
+def _init_worker(pdf_path: str) -> None:
+    # Each worker parses the document once and then serves page indices from it.
+    global _worker_reader
+    _worker_reader = PdfReader(pdf_path)
+
+
+def _extract_page(index: int) -> str:
+    assert _worker_reader is not None
+    return _worker_reader.pages[index].extract_text() or ""
+
+
+def _extract_text_pdfium(pdf_path: str) -> Iterator[str]:
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        for i in range(len(pdf)):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            try:
+                # PDFium ends lines with CRLF; keep the text dump's line endings uniform.
+                yield textpage.get_text_range().replace("\r\n", "\n")
+            finally:
+                textpage.close()
+                page.close()
+    finally:
+        pdf.close()
 
 
-def extract_text_by_page(pdf_path: str) -> list[str]:
+def extract_text_by_page(pdf_path: str, *, backend: str = "pypdf") -> Iterator[str]:
+    """Yield each page's text in order, so callers never hold the whole document's text.
+
+    backend="pdfium" uses PDFium (pypdfium2, must be installed), which is far faster than
+    pypdf's pure-Python extractor. Its line breaks and spacing differ from pypdf's, so
+    candidate IDs are only stable within one backend.
+    """
+
+    if backend not in _BACKENDS:
+        raise ValueError(f"Unknown PDF text backend: {backend!r}")
+
+    if backend == "pdfium":
+        if pdfium is None:
+            raise RuntimeError("backend 'pdfium' requires the pypdfium2 package")
+        yield from _extract_text_pdfium(pdf_path)
+        return
+
     reader = PdfReader(pdf_path)
-    pages: list[str] = []
+    page_count = len(reader.pages)
+    workers = min(os.cpu_count() or 1, page_count // _PARALLEL_MIN_PAGES)
 
-    for page in reader.pages:
-        txt = page.extract_text() or ""
-        pages.append(txt)
+    if workers <= 1:
+        for page in reader.pages:
+            yield page.extract_text() or ""
+        return
 
-    return pages
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(pdf_path,)) as ex:
+        yield from ex.map(_extract_page, range(page_count), chunksize=max(1, page_count // (workers * 4)))
 
 
-def generate_candidates(pages: list[str]) -> list[Candidate]:
+def generate_candidates(pages: Iterable[str]) -> Iterator[Candidate]:
     """Heuristic candidate extraction.
 
     Datasheets often encode requirements as specs and bullet points rather than 'shall' statements.
     We look for short-ish lines that contain numbers/units, keywords, or list bullets.
     """
 
-    candidates: list[Candidate] = []
     counter = 1
 
-    keywords = re.compile(
-        r"\b(must|shall|should|support|supports|require|required|minimum|maximum|max|min|operating|temperature|humidity|throughput|latency|power|voltage|current|frequency|protocol)\b",
-        re.IGNORECASE,
-    )
-    has_number_or_unit = re.compile(r"(\d|%|\bms\b|\bps\b|\bmhz\b|\bghz\b|\bmbps\b|\bgbps\b|\bdb\b|\bmm\b|\bcm\b|\bkg\b|\bw\b|\bv\b|\ba\b)", re.IGNORECASE)
-
     for page_index, raw in enumerate(pages, start=1):
-        lines = [
-            _normalize_whitespace(line)
-            for line in (raw or "").splitlines()
-            if _normalize_whitespace(line)
-        ]
+        collapsed = _INLINE_WS_RE.sub(" ", raw or "")
+        lines = [line for line in (ln.strip() for ln in collapsed.splitlines()) if line]
 
         for line in lines:
             if len(line) < 20:
@@ -60,16 +131,21 @@ def generate_candidates(pages: list[str]) -> list[Candidate]:
             if len(line) > 200:
                 continue
 
-            looks_like_bullet = line.startswith(("-", "•", "*"))
-            interesting = bool(keywords.search(line) or has_number_or_unit.search(line) or looks_like_bullet)
-            if not interesting:
+            # Bullets qualify on their own, so the regex only runs for the other lines.
+            if line[0] not in _BULLETS and not _INTERESTING_RE.search(line):
                 continue
 
             cid = f"CAND-{counter:04d}"
             counter += 1
-            candidates.append(Candidate(id=cid, page=page_index, text=line))
+            yield Candidate(id=cid, page=page_index, text=line)
 
-    return candidates
+
+def _write_pages(pages: Iterable[str], f: TextIO) -> Iterator[str]:
+    for i, txt in enumerate(pages, start=1):
+        f.write(f"===== PAGE {i} =====\n")
+        f.write((txt or "").rstrip())
+        f.write("\n\n")
+        yield txt
 
 
 def main() -> int:
@@ -80,23 +156,35 @@ def main() -> int:
         default="requirements",
         help="Output directory (default: requirements)",
     )
+    parser.add_argument(
+        "--backend",
+        choices=_BACKENDS,
+        default="pypdf",
+        help="Text extraction backend (default: pypdf; pdfium needs pypdfium2 and is faster)",
+    )
+    parser.add_argument(
+        "--emit-text",
+        action="store_true",
+        help="Also write the raw per-page text dump (eyesight_text_by_page.txt)",
+    )
     args = parser.parse_args()
+    if args.backend == "pdfium" and pdfium is None:
+        parser.error("--backend pdfium requires the pypdfium2 package")
 
     pdf_path = args.pdf
     out_dir = args.out_dir
 
     os.makedirs(out_dir, exist_ok=True)
 
-    pages = extract_text_by_page(pdf_path)
-
-    text_out = os.path.join(out_dir, "eyesight_text_by_page.txt")
-    with open(text_out, "w", encoding="utf-8") as f:
-        for i, txt in enumerate(pages, start=1):
-            f.write(f"===== PAGE {i} =====\n")
-            f.write((txt or "").rstrip())
-            f.write("\n\n")
-
-    candidates = generate_candidates(pages)
+    pages = extract_text_by_page(pdf_path, backend=args.backend)
+    text_out = None
+    if args.emit_text:
+        text_out = os.path.join(out_dir, "eyesight_text_by_page.txt")
+        with open(text_out, "w", encoding="utf-8") as f:
+            # One pass over the PDF: each page is written out as it is scanned for candidates.
+            candidates = list(generate_candidates(_write_pages(pages, f)))
+    else:
+        candidates = list(generate_candidates(pages))
 
     cand_out = os.path.join(out_dir, "eyesight_candidates.yaml")
     payload = {
@@ -116,9 +204,10 @@ def main() -> int:
     }
 
     with open(cand_out, "w", encoding="utf-8") as f:
-        yaml.safe_dump(payload, f, sort_keys=False, allow_unicode=True)
+        yaml.dump(payload, f, Dumper=_SafeDumper, sort_keys=False, allow_unicode=True)
 
-    print(f"Wrote: {text_out}")
+    if text_out:
+        print(f"Wrote: {text_out}")
     print(f"Wrote: {cand_out} ({len(candidates)} candidates)")
     return 0
 
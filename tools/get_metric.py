@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import argparse
-import json
+import sys
 
+from regression.json_codec import dumps_bytes
 from regression.sut import load_sut_adapter
 
 
@@ -15,7 +16,7 @@ def main() -> int:
     value = sut.get_metric(args.metric)
 
     try:
-        print(json.dumps(value, indent=2, sort_keys=True))
+        sys.stdout.buffer.write(dumps_bytes(value, sort_keys=True) + b"\n")
     except TypeError:
         print(str(value))
 